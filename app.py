@@ -88,9 +88,13 @@ class Invaders(GameApp):
         _lives: the number of lives the ship has left[int]
         _bg: object of GImage to display the background[instance of GImage]
         _listOfShips: dictionary of ships [dictionary]
-        _scoreRecorder: a GLabel that shows the score [instance of GLabel]
-        _livesRecorder: a GLabel that shows the lives left [instance of GLabel]
+        _scoreRecorder: a label that shows the score [instance of GBitmapLabel]
+        _livesRecorder: a label that shows the lives left
+                        [instance of GBitmapLabel]
         _lastClick: True if you have clicked before, defaut to False [boolean]
+        _assetState: the state whose assets were loaded last [int or None]
+        _assets: the assets loaded for _assetState and the states that can
+                 follow it [tuple of str]
     """
 
     # DO NOT MAKE A NEW INITIALIZER!
@@ -108,7 +112,15 @@ class Invaders(GameApp):
         create a message (in attribute _text) saying that the user should
         press to play a game.
         """
+        # Only redraw what changes between frames
+        self.view.retained=True
+        # Pack the small images into shared textures before making sprites
+        if len(self.ATLAS_PAGES)==0:
+            self.build_atlas()
         self._state=STATE_PREP
+        self._assetState=None
+        self._assets=()
+        self.loadAssets()
         self.state_output()
         self._listOfShips=[]
         for i in range(1,NUM_SHIPS+1):
@@ -124,16 +136,14 @@ class Invaders(GameApp):
                 halign='center',valign='middle', linecolor='white')
         self._wave=None
         self._score=[0]
-        self._scoreRecorder=GLabel(text='Score: '+ str(self._score[0]),
+        self._scoreRecorder=GBitmapLabel(text='Score: '+ str(self._score[0]),
                          x=80,y=650,font_size=25,
-                        font_name='ComicSans.ttf',width=100,height=40,bold=True,
-                        halign='center',valign='middle',linecolor='red')
-        self._bgm=Sound('bgm.wav')
+                        font_name='ComicSans.ttf',bold=True,linecolor='red')
+        self._bgm=self.load_sound('bgm.wav')
         self._lives=SHIP_LIVES
-        self._livesRecorder=GLabel(text='Lives: '+ str(self._lives) ,x=700,y=650
-                         ,font_size=25,
-                        font_name='ComicSans.ttf',width=100,height=40,bold=True,
-                        halign='center',valign='middle', linecolor='red')
+        self._livesRecorder=GBitmapLabel(text='Lives: '+ str(self._lives)
+                         ,x=700,y=650,font_size=25,
+                        font_name='ComicSans.ttf',bold=True,linecolor='red')
         self._bg=GImage(x=GAME_WIDTH/2,y=GAME_HEIGHT/2,
                     width=GAME_WIDTH,height=GAME_HEIGHT,source='space.png')
         self._lastClick=None
@@ -214,15 +224,14 @@ class Invaders(GameApp):
             self._detect_s()
         if self._state==STATE_CONTINUE:
             self._wave.setShip()
-            self._wave.setVolume()
             self._state=STATE_ACTIVE
         if self._state==STATE_COMPLETE:
             self.update_complete(dt)
         if self._state==STATE_AGAIN:
             self.update_restart(dt)
         if self._state==STATE_PREP:
-            self.start()
             self._checkClick()
+        self.loadAssets()
 
     def draw(self):
         """
@@ -267,6 +276,41 @@ class Invaders(GameApp):
             self._animateText()
 
     # HELPER METHODS FOR THE STATES GO HERE
+    def loadAssets(self):
+        """
+        Loads the assets for the current state and the states that can follow.
+
+        This method is a helper function of the function update. It does
+        nothing unless the state changed since the last call. Otherwise it
+        looks up STATE_ASSETS for the current state and every state that can
+        come up to STATE_LOOKAHEAD states after it (following STATE_NEXT),
+        loads any of those assets that are not loaded yet, and releases the
+        assets that were loaded for the last state but are not needed any
+        more. Looking more than one state ahead keeps, for example, the sound
+        effects loaded through STATE_AGAIN and STATE_NEWWAVE, which do not
+        play them, between two STATE_ACTIVE waves. The assets of the current
+        state are loaded right away with preload, since the state is about to
+        draw them; the assets of the states after it are decoded on background
+        threads by load_async, so the frame that starts those loads does not
+        wait on the disk. An asset of the current state that is already on its
+        way from an earlier call is left to arrive, so it is not decoded twice.
+        """
+        if self._assetState==self._state:
+            return
+        needed=list(STATE_ASSETS[self._state])
+        self.preload([name for name in needed if not self.loading([name])])
+        states=[self._state]
+        for step in range(STATE_LOOKAHEAD):
+            states=[nxt for state in states for nxt in STATE_NEXT[state]]
+            for state in states:
+                for name in STATE_ASSETS[state]:
+                    if not name in needed:
+                        needed.append(name)
+        self.release([name for name in self._assets if not name in needed])
+        self.load_async(needed)
+        self._assets=tuple(needed)
+        self._assetState=self._state
+
     def state_output(self):
         """
         Ouputs all the text on screen corresonding to each state.
@@ -351,30 +395,21 @@ class Invaders(GameApp):
         """
         Returns True if all the aliens are dead; Falso otherwise.
 
-        This method is a helper function of the function update. It loops
-        through all the aliens to check if all of them are None.
+        This method is a helper function of the function update. It asks the
+        wave how many aliens are still alive.
         """
-        for i in range(ALIEN_ROWS):
-            for j in range(ALIENS_IN_ROW):
-                if self._wave.getWaveAlien(m=i,n=j)!=None:
-                    return False
-        return True
+        return self._wave.getNumAliens()==0
 
     def passDline(self):
         """
         Returns True if any of the alien passes the defense line; False
         otherwise.
 
-        This method is a helper function of the function update. It loops
-        through all the aliens to check if any of them thouchs the defense line.
+        This method is a helper function of the function update. It compares
+        the bottom edge of the lowest alien with the defense line.
         """
-        for i in range(ALIEN_ROWS):
-            for j in range(ALIENS_IN_ROW):
-                if self._wave.getWaveAlien(i,j)!=None:
-                    if (self._wave.getWaveAlien(i,j).getY()-ALIEN_HEIGHT/2<=
-                        DEFENSE_LINE):
-                        return True
-        return False
+        bottom=self._wave.getAlienBottom()
+        return bottom!=None and bottom<=DEFENSE_LINE
 
     def changeStates(self):
         """
@@ -396,12 +431,11 @@ class Invaders(GameApp):
             self._state=STATE_COMPLETE
         # When all aliens are dead and when the player has lives remaining.
         # Also this is no
-        if (self.allAliensDead() and self._wave.getLives()>0
-             and MAX_NUM_OF_WAVE-self._curwave<=1):
+        cleared=self.allAliensDead() and self._wave.getLives()>0
+        if cleared and MAX_NUM_OF_WAVE-self._curwave<=1:
             self._status=True
             self._state=STATE_COMPLETE
-        if (self.allAliensDead() and self._wave.getLives()>0
-             and self._curwave<MAX_NUM_OF_WAVE):
+        if cleared and self._curwave<MAX_NUM_OF_WAVE:
             self._state=STATE_AGAIN
         if self.passDline():
             self._status=False
@@ -413,8 +447,13 @@ class Invaders(GameApp):
 
         This method is a helper function of the function update. If the state
         is STATE_NEWWAV, the method is called to handle every update in that
-        state.
+        state. The wave is not made until every asset it uses has finished
+        loading in the background; until then the state stays the same and
+        only the background is drawn.
         """
+        self.loadAssets()
+        if self.loading(STATE_ASSETS[STATE_ACTIVE]):
+            return
         if self._wave!=None:
             self._wave=Wave(bgm=self._bgm,s=self._finalShip,
         life=self._wave.getLives(),barrierwall=self._wave.getBarrierWall())
@@ -72,6 +72,11 @@ BOLT_HEIGHT = 16
 BOLT_SPEED  = 10
 # the number of ALIEN STEPS (not frames) between bolts
 BOLT_RATE   = 5
+# the maximum number of bolts (player and alien) on screen at once
+BOLT_POOL_SIZE = 64
+# with fewer bolts than this on screen, collisions are tested one bolt at a
+# time; NumPy only pays off once its per-call overhead is shared by many bolts
+BOLT_VECTOR_MIN = 16
 
 
 ### GAME CONSTANTS ###
@@ -168,3 +173,50 @@ BARRIER_WALL_WIDTH = 80
 BARRIER_WALL_HEIGHT = 50
 # the maximum number of bolts to change the frame of the barrierwall
 BARRIER_WALL_RESISTANCE = 10
+# the largest size (width, height) each image is drawn at, for optimize.py;
+# filmstrips are the size of a frame times the number of columns and rows
+IMAGE_SIZES = {
+    'ship1.png': (max(SHIP_WIDTH,SHIP_OPTION_WIDTH),
+                  max(SHIP_HEIGHT,SHIP_OPTION_HEIGHT)),
+    'ship2.png': (max(SHIP_WIDTH,SHIP_OPTION_WIDTH),
+                  max(SHIP_HEIGHT,SHIP_OPTION_HEIGHT)),
+    'ship3.png': (max(SHIP_WIDTH,SHIP_OPTION_WIDTH),
+                  max(SHIP_HEIGHT,SHIP_OPTION_HEIGHT)),
+    'barrierwall.png': (2*BARRIER_WALL_WIDTH,2*BARRIER_WALL_HEIGHT),
+    'space.png': (GAME_WIDTH,GAME_HEIGHT),
+    }
+# the images, fonts and sounds each state draws or plays
+STATE_ASSETS = {
+    STATE_PREP: ('space.png','ship1.png','ship2.png','ship3.png',
+                 'RetroGame.ttf','bgm.wav'),
+    STATE_INACTIVE: ('space.png','RetroGame.ttf','ComicSans.ttf','bgm.wav'),
+    STATE_NEWWAVE: ('space.png','ship1.png','ship2.png','ship3.png',
+                    'barrierwall.png','bgm.wav')+ALIEN_IMAGES,
+    STATE_ACTIVE: ('space.png','ship1.png','ship2.png','ship3.png',
+                   'barrierwall.png','ComicSans.ttf','bgm.wav','blast2.wav',
+                   'blast3.wav','pew1.wav','pop1.wav')+ALIEN_IMAGES,
+    STATE_PAUSED: ('space.png','ship1.png','ship2.png','ship3.png',
+                   'barrierwall.png','RetroGame.ttf','ComicSans.ttf',
+                   'bgm.wav')+ALIEN_IMAGES,
+    STATE_CONTINUE: ('space.png','ship1.png','ship2.png','ship3.png',
+                     'barrierwall.png','ComicSans.ttf','bgm.wav')+ALIEN_IMAGES,
+    STATE_COMPLETE: ('space.png','RetroGame.ttf','ComicSans.ttf','bgm.wav'),
+    STATE_AGAIN: ('space.png','barrierwall.png','RetroGame.ttf',
+                  'ComicSans.ttf','bgm.wav'),
+    STATE_RESTART: ('space.png','RetroGame.ttf','ComicSans.ttf','bgm.wav'),
+    }
+# the states that can come right after each state; their assets are loaded
+# while the earlier state is still running
+STATE_NEXT = {
+    STATE_PREP: (STATE_INACTIVE,),
+    STATE_INACTIVE: (STATE_NEWWAVE,),
+    STATE_NEWWAVE: (STATE_ACTIVE,),
+    STATE_ACTIVE: (STATE_PAUSED,STATE_COMPLETE,STATE_AGAIN),
+    STATE_PAUSED: (STATE_CONTINUE,),
+    STATE_CONTINUE: (STATE_ACTIVE,),
+    STATE_COMPLETE: (STATE_INACTIVE,),
+    STATE_AGAIN: (STATE_NEWWAVE,),
+    STATE_RESTART: (STATE_NEWWAVE,),
+    }
+# how many states ahead (following STATE_NEXT) assets are kept loaded for
+STATE_LOOKAHEAD = 2
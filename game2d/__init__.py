@@ -8,9 +8,9 @@ Author: Walker M. White (wmw2)
 Date:   August 1, 2017 (Python 3 version)
 """
 from .gobject import GObject, GScene
-from .grectangle import GRectangle, GEllipse, GImage, GLabel
-from .gsprite import GSprite
+from .grectangle import GRectangle, GEllipse, GImage, GLabel, GBitmapLabel
+from .gsprite import GSprite, GSpriteBatch
 from .gpath import GPath, GTriangle, GPolygon
 from .gview import GInput, GView
-from .sound import Sound, SoundLibrary
+from .sound import Sound, SoundLibrary, Bus, Mixer
 from .app import GameApp
\ No newline at end of file
@@ -16,6 +16,8 @@ from kivy.config import Config
 from kivy.clock  import Clock
 
 import os.path
+import queue
+from concurrent.futures import ThreadPoolExecutor
 
 class GameApp(kivy.app.App):
     """
@@ -38,6 +40,25 @@ class GameApp(kivy.app.App):
     """
     # Class attribute for tracking textures (to reduce memory footprint)
     TEXTURE_CACHE = {}
+    # Class attribute for sharing filmstrip frames, keyed by (name, format)
+    FRAME_CACHE = {}
+    # Class attribute for the atlas pages made by build_atlas
+    ATLAS_PAGES = []
+    # Class attribute for the region of each image packed by build_atlas
+    ATLAS_REGIONS = {}
+    # Class attribute for tracking loaded sounds, keyed by file name
+    SOUND_CACHE = {}
+    # Class attribute for the fonts that have been loaded
+    FONT_CACHE = set()
+    # Class attribute for the extra copies of each sound made by load_voices
+    VOICE_CACHE = {}
+    # Class attribute for the number of copies asked of load_voices for each sound
+    VOICE_COUNT = {}
+    # Class attributes for decoding assets off the main thread (see load_async)
+    LOAD_WORKERS = 2
+    LOAD_POOL = None
+    LOAD_QUEUE = queue.Queue()
+    LOAD_PENDING = set()
     
     
     # MUTABLE ATTRIBUTES
@@ -62,8 +83,67 @@ class GameApp(kivy.app.App):
         self._fps = value
         Clock.schedule_interval(self._refresh,1.0/self._fps)
     
+    @property
+    def tick(self):
+        """
+        The number of fixed simulation steps per second, or None.
+        
+        If this value is None (the default), :meth:`update` is called exactly once 
+        per animation frame with the ``dt`` reported by the clock.  Otherwise the 
+        elapsed time is stored in an accumulator and :meth:`update` is called with 
+        ``dt = 1.0/tick`` as many times as the accumulated time allows.  That way the 
+        game runs at the same speed no matter how fast it is drawn.  Use the attribute
+        :attr:`alpha` in :meth:`draw` to interpolate between the last two steps.
+        
+        **Invariant**: Must be None or an int or float > 0.
+        """
+        return self._tick
+    
+    @tick.setter
+    def tick(self,value):
+        assert value is None or type(value) in [int,float], 'value %s is not a number' % repr(value)
+        assert value is None or value > 0, 'value %s is not positive' % repr(value)
+        self._tick = value
+        self._accum = 0.0
+        self._alpha = 1.0
+    
+    @property
+    def max_steps(self):
+        """
+        The maximum number of fixed simulation steps in a single animation frame.
+        
+        This value only matters if :attr:`tick` is not None.  If a frame takes so long
+        that more steps are owed than this value, the extra time is thrown away rather 
+        than simulated.  This keeps a slow frame from causing an even slower frame 
+        (the "spiral of death").  The default value is 5.
+        
+        **Invariant**: Must be an int > 0.
+        """
+        return self._maxsteps
+    
+    @max_steps.setter
+    def max_steps(self,value):
+        assert type(value) == int, 'value %s is not an int' % repr(value)
+        assert value > 0, 'value %s is not positive' % repr(value)
+        self._maxsteps = value
+    
     
     # IMMUTABLE PROPERTIES
+    @property
+    def alpha(self):
+        """
+        The fraction of a simulation step left over when drawing.
+        
+        If :attr:`tick` is not None, this is the time remaining in the accumulator 
+        divided by the step size.  A value of 0.25 means that the frame is drawn a 
+        quarter of the way from the last simulation step to the next one, so a 
+        position can be drawn as ``prev+(curr-prev)*alpha``.  If :attr:`tick` is 
+        None, this value is always 1.
+        
+        **Invariant**: Must be a float in the range 0..1.
+        """
+        return self._alpha
+    
     @property
     def width(self):
         """
@@ -161,6 +241,24 @@ class GameApp(kivy.app.App):
         
         return os.path.exists(os.path.join(cls.sounds,name))
     
+    @classmethod
+    def image_path(cls,name):
+        """
+        Returns: The path of the file to load for the image ``name``
+        
+        If the **ImageCache** folder next to **Images** has a file with this name, this
+        is the path to that file, which is a copy of the image shrunk to the largest 
+        size the game draws it at (see ``optimize.py``).  Otherwise, it is the path to
+        the file in **Images**.
+        
+        :param name: The file name
+        :type name:  ``str``
+        """
+        path = os.path.join(cls.cache,name)
+        if os.path.exists(path):
+            return path
+        return os.path.join(cls.images,name)
+    
     @classmethod
     def load_texture(cls,name):
         """
@@ -168,7 +266,8 @@ class GameApp(kivy.app.App):
         
         The ``name`` must refer to the file in the **Images** folder.  If the texture
         has already been loaded, it will return the cached texture.  Otherwise, it will
-        load the texture and cache it before returning it.
+        load the texture and cache it before returning it.  The texture is loaded from 
+        the optimized copy in **ImageCache** if there is one (see :meth:`image_path`).
         
         This method will crash if name is not a valid file.
         
@@ -178,16 +277,136 @@ class GameApp(kivy.app.App):
         assert cls.is_image(name), '%s is not an image file' % repr(name)
         if name in cls.TEXTURE_CACHE:
             return cls.TEXTURE_CACHE[name]
+        if name in cls.ATLAS_REGIONS:
+            # Released earlier, but the atlas page still holds it
+            cls.TEXTURE_CACHE[name] = cls.ATLAS_REGIONS[name]
+            return cls.ATLAS_REGIONS[name]
         
         try:
             from kivy.core.image import Image
-            texture = Image(name).texture
+            texture = Image(cls.image_path(name)).texture
             cls.TEXTURE_CACHE[name] = texture
         except:
             texture = None
         
         return texture
     
+    @classmethod
+    def build_atlas(cls,names=None,size=1024):
+        """
+        Packs images into shared atlas pages and caches a region for each one.
+        
+        Every image gets its own texture when loaded with :meth:`load_texture`, so 
+        drawing several images means binding several textures each frame.  This 
+        method loads the images, packs them onto as few ``size`` x ``size`` textures 
+        as it can, and puts the region of each image in the texture cache under its 
+        file name.  Later calls to :meth:`load_texture` and :meth:`load_frames` return 
+        these regions, so :class:`GImage` and :class:`GSprite` use the atlas without 
+        any change to their ``source``.  Only objects created after this call use it.
+        
+        Images larger than a page, and images whose pixels are not RGBA, keep their
+        own texture.  The images are packed tallest first into rows (shelves), with a 
+        one pixel gap so that neighbours do not bleed into each other.
+        
+        This method must be called after the game window exists, such as in 
+        :meth:`start`.
+        
+        :param names: The file names to pack, or None for every file in **Images**
+        :type names:  ``list`` of ``str`` or None
+        
+        :param size: The width and height of each atlas page
+        :type size:  ``int`` > 0
+        """
+        assert type(size) == int and size > 0, '%s is not a valid page size' % repr(size)
+        from kivy.core.image import ImageLoader
+        from kivy.graphics.texture import Texture
+        
+        if names is None:
+            names = sorted(os.listdir(cls.images))
+        
+        images = []
+        for name in names:
+            if not cls.is_image(name):
+                continue
+            try:
+                data = ImageLoader.load(cls.image_path(name),keep_data=True,nocache=True)._data[0]
+            except:
+                continue
+            if data.fmt == 'rgba' and data.width < size and data.height < size:
+                images.append((data.height,data.width,name,data))
+        images.sort(key=lambda item: (-item[0],-item[1],item[2]))
+        
+        pages = []
+        page = None
+        for (height, width, name, data) in images:
+            if page is None or page[1]+width > size:
+                # Start a new shelf
+                if page is None or page[2]+page[3]+height > size:
+                    page = [[],0,0,0]
+                    pages.append(page)
+                else:
+                    page[2] += page[3]
+                    page[1] = 0
+                    page[3] = 0
+            page[0].append((name,data,page[1],page[2]))
+            page[1] += width+1
+            page[3] = max(page[3],height+1)
+        
+        for (contents, tx, ty, th) in pages:
+            texture = Texture.create(size=(size,size),colorfmt='rgba')
+            for (name,data,x,y) in contents:
+                texture.blit_data(data,pos=(x,y))
+            # Image rows are stored top-down, as with a loaded texture
+            texture.flip_vertical()
+            for (name,data,x,y) in contents:
+                cls.unload_texture(name)
+                region = texture.get_region(x,size-y-data.height,data.width,data.height)
+                cls.ATLAS_REGIONS[name] = region
+                cls.TEXTURE_CACHE[name] = region
+            cls.ATLAS_PAGES.append(texture)
+    
+    @classmethod
+    def load_frames(cls,name,format):
+        """
+        Returns: The frames of the filmstrip in the given file, or None if it cannot be loaded
+        
+        The filmstrip is the texture :meth:`load_texture` returns for ``name``, cut into
+        a grid with ``format[0]`` rows and ``format[1]`` columns.  The frames are regions
+        of that texture, listed left-to-right, top-to-bottom.  They are cut the first 
+        time a filmstrip is asked for with this format, and every later call returns the
+        same tuple, so all sprites on the same filmstrip share their frames.
+        
+        This method will crash if name is not a valid file.
+        
+        :param name: The file name
+        :type name:  ``str``
+        
+        :param format: The filmstrip grid size as (rows, columns)
+        :type format:  2-element tuple of ints > 0
+        """
+        key = (name,format)
+        if key in cls.FRAME_CACHE:
+            return cls.FRAME_CACHE[key]
+        
+        texture = cls.load_texture(name)
+        if texture is None:
+            return None
+        
+        width  = texture.width/format[1]
+        height = texture.height/format[0]
+        frames = []
+        ty = 0
+        for row in range(format[0]):
+            tx = 0
+            for col in range(format[1]):
+                frames.append(texture.get_region(int(tx),texture.height-int(ty)-int(height),int(width),int(height)))
+                tx += width
+            ty += height
+        
+        frames = tuple(frames)
+        cls.FRAME_CACHE[key] = frames
+        return frames
+    
     @classmethod
     def unload_texture(cls,name):
         """
@@ -195,12 +414,15 @@ class GameApp(kivy.app.App):
         
         The ``name`` should refer to the file in in the texture cache.  If the texture
         is in the cache, it will return the cached texture before removing it.  Otherwise, 
-        it will returning None.
+        it will returning None.  Any filmstrip frames cut from the texture are dropped 
+        as well.
         
         :param name: The file name
         :type name:  ``str``
         """
         assert type(name) == str, '%s is not a valid texture name' % repr(name)
+        for key in [key for key in cls.FRAME_CACHE if key[0] == name]:
+            del cls.FRAME_CACHE[key]
         if name in cls.TEXTURE_CACHE:
             texture = cls.TEXTURE_CACHE[name]
             del cls.TEXTURE_CACHE[name]
@@ -208,6 +430,256 @@ class GameApp(kivy.app.App):
         
         return None
     
+    @classmethod
+    def load_sound(cls,name):
+        """
+        Returns: The sound for the given file name
+        
+        The ``name`` must refer to the file in the **Sounds** folder.  If the sound has
+        already been loaded, it will return the cached :class:`Sound`, so everyone
+        who asks for a file shares one object.  Otherwise, it will load the sound and
+        cache it before returning it.
+        
+        This method will crash if name is not a valid file.
+        
+        :param name: The file name
+        :type name:  ``str``
+        """
+        assert cls.is_sound(name), '%s is not a sound file' % repr(name)
+        if name in cls.SOUND_CACHE:
+            return cls.SOUND_CACHE[name]
+        
+        from .sound import Sound
+        sound = Sound(name)
+        cls.SOUND_CACHE[name] = sound
+        return sound
+    
+    @classmethod
+    def unload_sound(cls,name):
+        """
+        Returns: The sound for the given file name, or None if it does not exist
+        
+        If the sound is in the cache, it will return the cached sound before removing 
+        it.  The sound is not stopped, so a sound that is still playing will finish.
+        Otherwise, it will returning None.
+        
+        :param name: The file name
+        :type name:  ``str``
+        """
+        assert type(name) == str, '%s is not a valid sound name' % repr(name)
+        if name in cls.SOUND_CACHE:
+            sound = cls.SOUND_CACHE[name]
+            del cls.SOUND_CACHE[name]
+            return sound
+        
+        return None
+    
+    @classmethod
+    def load_font(cls,name):
+        """
+        Loads the font in the given file, if it is not loaded already.
+        
+        The ``name`` must refer to the file in the **Fonts** folder.  Kivy keeps every
+        font it opens, so this method only opens the font by rendering a single 
+        character with it.  That way the first label to use the font does not pay for
+        opening it.
+        
+        :param name: The file name
+        :type name:  ``str``
+        """
+        assert cls.is_font(name), '%s is not a font file' % repr(name)
+        if name in cls.FONT_CACHE:
+            return
+        
+        from kivy.core.text import Label as CoreLabel
+        CoreLabel(text='0',font_name=name).refresh()
+        cls.FONT_CACHE.add(name)
+    
+    @classmethod
+    def preload(cls,names):
+        """
+        Loads every image, font and sound in ``names`` that is not loaded already.
+        
+        Each name is sorted by the folder it is in: images are loaded with
+        :meth:`load_texture`, fonts with :meth:`load_font` and sounds with 
+        :meth:`load_sound`.  Names in none of these folders are ignored.  Call this 
+        ahead of time with the assets a part of the game is about to need, so that
+        nothing is read from disk when it starts.
+        
+        :param names: The file names to load
+        :type names:  iterable of ``str``
+        """
+        for name in names:
+            if cls.is_image(name):
+                cls.load_texture(name)
+            elif cls.is_font(name):
+                cls.load_font(name)
+            elif cls.is_sound(name):
+                cls.load_sound(name)
+    
+    @classmethod
+    def release(cls,names):
+        """
+        Removes every image and sound in ``names`` from the caches.
+        
+        Objects that already use an asset keep it; it is only dropped from the cache,
+        so it is freed once nothing uses it.  An asset still being loaded by 
+        :meth:`load_async` is dropped when it arrives.  Releasing a sound also drops
+        its copies from :meth:`load_voices`.  Sounds in the shared 
+        :class:`SoundLibrary` are kept, with their copies, as the library would keep
+        them alive anyway.
+        Fonts stay loaded, as Kivy has no way to close them.
+        
+        :param names: The file names to release
+        :type names:  iterable of ``str``
+        """
+        from .sound import SoundLibrary
+        library = SoundLibrary.shared()
+        for name in names:
+            if cls.is_image(name):
+                cls.LOAD_PENDING.discard(name)
+                cls.unload_texture(name)
+            elif cls.is_sound(name) and not library.uses(name):
+                cls.LOAD_PENDING.discard(name)
+                cls.unload_sound(name)
+                for key in [key for key in cls.LOAD_PENDING
+                            if type(key) == tuple and key[0] == name]:
+                    cls.LOAD_PENDING.discard(key)
+                cls.VOICE_CACHE.pop(name,None)
+                cls.VOICE_COUNT.pop(name,None)
+    
+    @classmethod
+    def load_async(cls,names):
+        """
+        Starts loading every image and sound in ``names`` on a background thread.
+        
+        Images and sounds that are not cached or already on their way are handed to a
+        pool of :attr:`LOAD_WORKERS` threads, which read and decode the files.  The 
+        threads put what they decode on :attr:`LOAD_QUEUE`, and the game caches it at 
+        the start of the next frame (see :meth:`finish_loads`), because Kivy textures 
+        can only be made on the main thread.  Use :meth:`loading` to find out if the 
+        assets have arrived.  Fonts are loaded right away with :meth:`load_font`, as 
+        opening a font needs the main thread too.
+        
+        Asking for an asset with :meth:`load_texture` or :meth:`load_sound` before it
+        arrives loads it the slow way; the decoded copy is then thrown away.
+        
+        :param names: The file names to load
+        :type names:  iterable of ``str``
+        """
+        for name in names:
+            if name in cls.LOAD_PENDING:
+                continue
+            if cls.is_image(name):
+                if name in cls.TEXTURE_CACHE or name in cls.ATLAS_REGIONS:
+                    continue
+                job = cls._decode_image
+            elif cls.is_sound(name):
+                if name in cls.SOUND_CACHE:
+                    continue
+                job = cls._decode_sound
+            elif cls.is_font(name):
+                cls.load_font(name)
+                continue
+            else:
+                continue
+            cls._submit(job,name)
+    
+    @classmethod
+    def load_voices(cls,name,count):
+        """
+        Starts loading extra copies of a sound on a background thread.
+        
+        A :class:`Sound` can only play once at a time, so playing a sound over itself 
+        needs more copies of it (see :class:`Mixer`).  This method makes sure that 
+        ``count`` copies of the sound ``name`` are cached or on their way; it never
+        decodes anything on the calling thread.  The copies arrive the same way as 
+        the assets from :meth:`load_async`, and :meth:`voices` returns the ones that
+        have arrived so far.
+        
+        :param name: The file name
+        :type name:  ``str``
+        
+        :param count: The number of copies
+        :type count:  ``int`` >= 0
+        """
+        assert cls.is_sound(name), '%s is not a sound file' % repr(name)
+        count = max(count,cls.VOICE_COUNT.get(name,0))
+        cls.VOICE_COUNT[name] = count
+        pending = [key for key in cls.LOAD_PENDING if type(key) == tuple and key[0] == name]
+        missing = count-len(cls.VOICE_CACHE.get(name,()))-len(pending)
+        index = 0
+        while missing > 0:
+            if not (name,index) in cls.LOAD_PENDING:
+                cls._submit(cls._decode_sound,(name,index))
+                missing -= 1
+            index += 1
+    
+    @classmethod
+    def voices(cls,name):
+        """
+        Returns: The extra copies of the sound ``name`` loaded by :meth:`load_voices`
+        
+        The list is empty if no copies have arrived yet.  It belongs to the cache, so 
+        it must not be modified.
+        
+        :param name: The file name
+        :type name:  ``str``
+        """
+        return cls.VOICE_CACHE.get(name,[])
+    
+    @classmethod
+    def finish_loads(cls):
+        """
+        Caches every asset the background threads have finished decoding.
+        
+        This method runs on the main thread at the start of every frame, so you never 
+        need to call it yourself.  Each decoded image becomes a texture in the texture 
+        cache, and each sound goes in the sound cache (or, for a copy made by 
+        :meth:`load_voices`, in the voice cache), unless the asset was loaded or 
+        released while it was being decoded.  Copies are kept in the order they 
+        arrive, up to the number asked of :meth:`load_voices`.  A file that could not be read is 
+        dropped, so :meth:`load_texture` or :meth:`load_sound` will report it when the
+        asset is used.
+        """
+        while True:
+            try:
+                (name, data) = cls.LOAD_QUEUE.get_nowait()
+            except queue.Empty:
+                return
+            if not name in cls.LOAD_PENDING:
+                continue
+            cls.LOAD_PENDING.discard(name)
+            if data is None:
+                continue
+            if type(name) == tuple:
+                copies = cls.VOICE_CACHE.setdefault(name[0],[])
+                if len(copies) < cls.VOICE_COUNT.get(name[0],0):
+                    copies.append(data)
+            elif cls.is_image(name):
+                if not name in cls.TEXTURE_CACHE:
+                    from kivy.graphics.texture import Texture
+                    cls.TEXTURE_CACHE[name] = Texture.create_from_data(data)
+            elif not name in cls.SOUND_CACHE:
+                cls.SOUND_CACHE[name] = data
+    
+    @classmethod
+    def loading(cls,names=None):
+        """
+        Returns: True if any asset in ``names`` is still being loaded by :meth:`load_async`
+        
+        If ``names`` is None, this checks every asset that is being loaded.
+        
+        :param names: The file names to check, or None for all of them
+        :type names:  iterable of ``str`` or None
+        """
+        if names is None:
+            return len(cls.LOAD_PENDING) > 0
+        for name in names:
+            if name in cls.LOAD_PENDING:
+                return True
+        return False
+    
     # BUILT-IN METHODS
     def __init__(self,**keywords):
         """
@@ -220,6 +692,11 @@ class GameApp(kivy.app.App):
             
             GameApp(width=400,height=400)
         
+        To run the game logic at a fixed 120 steps per second, no matter the frame
+        rate, add the keyword ``tick``::
+            
+            GameApp(width=400,height=400,tick=120)
+        
         The game window will not show until you start the game. To start the game, use 
         the method ``run()``.
         
@@ -232,6 +709,8 @@ class GameApp(kivy.app.App):
         w = keywords.pop('width', 0.0)
         h = keywords.pop('height', 0.0)
         f = keywords.pop('fps', 60.0)
+        t = keywords.pop('tick', None)
+        m = keywords.pop('max_steps', 5)
 
         assert type(w) in [int,float], 'width %s is not a number' % repr(w)
         assert type(h) in [int,float], 'height %s is not a number' % repr(h)
@@ -241,6 +720,8 @@ class GameApp(kivy.app.App):
         self._gwidth = w
         self._gheight = h
         self._fps = f
+        self.tick = t
+        self.max_steps = m
         
         Config.set('graphics', 'width', str(self.width))
         Config.set('graphics', 'height', str(self.height))
@@ -283,6 +764,8 @@ class GameApp(kivy.app.App):
         It should **never** be overridden.
         """
         import sys
+        if GameApp.LOAD_POOL is not None:
+            GameApp.LOAD_POOL.shutdown(wait=False)
         kivy.app.App.stop(self)
         sys.exit(0)
     
@@ -344,14 +827,90 @@ class GameApp(kivy.app.App):
         Processes a single animation frame.
         
         This method a callback-proxy for the methods `update` and `draw`.  It handles
-        important issues behind the scenes, particularly with clearing the window.
+        important issues behind the scenes, particularly with clearing the window
+        and caching the assets loaded in the background.
+        
+        If :attr:`tick` is set, this method also runs the fixed-step accumulator, 
+        calling `update` zero or more times before calling `draw`.
         
         :param dt: time in seconds since last update
         :type dt:  ``int`` or ``float``
         """
         self.view.clear()
-        self.update(dt)
+        self.finish_loads()
+        if self._tick is None:
+            self.update(dt)
+        else:
+            step = 1.0/self._tick
+            self._accum += dt
+            steps = 0
+            while self._accum >= step and steps < self._maxsteps:
+                self.update(step)
+                self._accum -= step
+                steps += 1
+            if self._accum >= step:
+                # Too far behind; drop the backlog instead of catching up
+                self._accum %= step
+            self._alpha = self._accum/step
         self.draw()
+        self.view._commit()
+    
+    @classmethod
+    def _decode_image(cls,name):
+        """
+        Reads and decodes the image ``name`` on a loader thread.
+        
+        The pixels are put on :attr:`LOAD_QUEUE` for :meth:`finish_loads`, or None if 
+        the file cannot be read.
+        
+        :param name: The file name
+        :type name:  ``str``
+        """
+        try:
+            from kivy.core.image import ImageLoader
+            data = ImageLoader.load(cls.image_path(name),keep_data=True,nocache=True)._data[0]
+        except:
+            data = None
+        cls.LOAD_QUEUE.put((name,data))
+    
+    @classmethod
+    def _decode_sound(cls,key):
+        """
+        Reads and decodes a sound on a loader thread.
+        
+        The ``key`` is either the file name, or the pair (file name, job number) for
+        a copy made by :meth:`load_voices`.  The :class:`Sound` is put on 
+        :attr:`LOAD_QUEUE` with the key for :meth:`finish_loads`, or None if the file
+        cannot be read.
+        
+        :param key: The file name, or the file name and job number
+        :type key:  ``str`` or (``str``, ``int``)
+        """
+        name = key if type(key) == str else key[0]
+        try:
+            from .sound import Sound
+            sound = Sound(name)
+        except:
+            sound = None
+        cls.LOAD_QUEUE.put((key,sound))
+    
+    @classmethod
+    def _submit(cls,job,key):
+        """
+        Marks ``key`` as loading and hands ``job`` for it to a loader thread.
+        
+        The thread pool is made the first time this method is called.
+        
+        :param job: The method that decodes the asset
+        :type job:  ``callable``
+        
+        :param key: The key of the asset, as used by :attr:`LOAD_PENDING`
+        :type key:  ``str`` or (``str``, ``int``)
+        """
+        if cls.LOAD_POOL is None:
+            cls.LOAD_POOL = ThreadPoolExecutor(max_workers=cls.LOAD_WORKERS)
+        cls.LOAD_PENDING.add(key)
+        cls.LOAD_POOL.submit(job,key)
     
     def _setpaths(self):
         """
@@ -368,6 +927,7 @@ class GameApp(kivy.app.App):
         GameApp.fonts  = str(os.path.join(path, 'Fonts'))
         GameApp.sounds = str(os.path.join(path, 'Sounds'))
         GameApp.images = str(os.path.join(path, 'Images'))
+        GameApp.cache  = str(os.path.join(path, 'ImageCache'))
         
         import kivy.resources
         kivy.resources.resource_add_path(GameApp.fonts)
@@ -11,6 +11,7 @@ Date:   August 1, 2017 (Python 3 version)
 from kivy.graphics import *
 from kivy.graphics.instructions import *
 from introcs.geom import Point2, Matrix
+import math
 
 def is_color(c):
     """
@@ -104,7 +105,7 @@ class GObject(object):
     def x(self,value):
         assert type(value) in [int,float], '%s is not a number' % repr(value)
         self._trans.x = float(value)
-        self._mtrue = False
+        self._invalidate()
 
     @property
     def y(self):
@@ -119,7 +120,7 @@ class GObject(object):
     def y(self,value):
         assert type(value) in [int,float], '%s is not a number' % repr(value)
         self._trans.y = float(value)
-        self._mtrue = False
+        self._invalidate()
 
     @property
     def width(self):
@@ -137,6 +138,7 @@ class GObject(object):
         assert type(value) in [int,float], '%s is not a number' % repr(value)
         assert value > 0, '%s is not positive' % repr(value)
         self._width = float(value)
+        self._invalidate()
         if self._defined:
             self._reset()
 
@@ -156,6 +158,7 @@ class GObject(object):
         assert type(value) in [int,float], '%s is not a number' % repr(value)
         assert value > 0, '%s is not positive' % repr(value)
         self._height = float(value)
+        self._invalidate()
         if self._defined:
             self._reset()
 
@@ -187,7 +190,7 @@ class GObject(object):
         else:
             self._scale.x = float(value[0])
             self._scale.y = float(value[1])
-        self._mtrue = False
+        self._invalidate()
 
     @property
     def angle(self):
@@ -203,10 +206,10 @@ class GObject(object):
     @angle.setter
     def angle(self,value):
         assert type(value) in [int,float], '%s is not a number' % repr(value)
-        diff = np.allclose([self._rotate.angle],[value])
+        same = self._rotate.angle == float(value)
         self._rotate.angle = float(value)
-        if not diff:
-            self._mtrue = False
+        if not same:
+            self._invalidate()
 
     @property
     def linecolor(self):
@@ -320,10 +323,10 @@ class GObject(object):
         if self._rotate.angle == 0.0:
             return self.x-self.width/2.0
 
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[0]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[0]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[0]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[0]
+        p0 = self._to_parent(self.x-self.width/2.0, self.y-self.height/2.0)[0]
+        p1 = self._to_parent(self.x+self.width/2.0, self.y-self.height/2.0)[0]
+        p2 = self._to_parent(self.x+self.width/2.0, self.y+self.height/2.0)[0]
+        p3 = self._to_parent(self.x-self.width/2.0, self.y+self.height/2.0)[0]
         return min(p0,p1,p2,p3)
 
     @left.setter
@@ -350,10 +353,10 @@ class GObject(object):
         if self._rotate.angle == 0.0:
             return self.x+self.width/2.0
 
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[0]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[0]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[0]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[0]
+        p0 = self._to_parent(self.x-self.width/2.0, self.y-self.height/2.0)[0]
+        p1 = self._to_parent(self.x+self.width/2.0, self.y-self.height/2.0)[0]
+        p2 = self._to_parent(self.x+self.width/2.0, self.y+self.height/2.0)[0]
+        p3 = self._to_parent(self.x-self.width/2.0, self.y+self.height/2.0)[0]
         return max(p0,p1,p2,p3)
 
     @right.setter
@@ -380,10 +383,10 @@ class GObject(object):
         if self._rotate.angle == 0.0:
             return self.y+self.height/2.0
 
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[1]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[1]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[1]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[1]
+        p0 = self._to_parent(self.x-self.width/2.0, self.y-self.height/2.0)[1]
+        p1 = self._to_parent(self.x+self.width/2.0, self.y-self.height/2.0)[1]
+        p2 = self._to_parent(self.x+self.width/2.0, self.y+self.height/2.0)[1]
+        p3 = self._to_parent(self.x-self.width/2.0, self.y+self.height/2.0)[1]
         return max(p0,p1,p2,p3)
 
     @top.setter
@@ -411,10 +414,10 @@ class GObject(object):
         if self._rotate.angle == 0.0:
             return self.y-self.height/2.0
 
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[1]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[1]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[1]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[1]
+        p0 = self._to_parent(self.x-self.width/2.0, self.y-self.height/2.0)[1]
+        p1 = self._to_parent(self.x+self.width/2.0, self.y-self.height/2.0)[1]
+        p2 = self._to_parent(self.x+self.width/2.0, self.y+self.height/2.0)[1]
+        p3 = self._to_parent(self.x-self.width/2.0, self.y+self.height/2.0)[1]
         return min(p0,p1,p2,p3)
 
 
@@ -432,12 +435,18 @@ class GObject(object):
         The transformation matrix for this object
 
         This value is constructed dynamically as needed.  It should only be used
-        internally in this package
+        internally in this package.  The package itself transforms points with plain
+        floats instead, so this object is only made when it is asked for.
 
         **invariant**: Either a :class:`Matrix` or ``None``
         """
-        if not self._mtrue or self._matrix is None:
+        if not self._mtrue:
             self._build_matrix()
+        if self._matrix is None:
+            self._matrix = Matrix()
+            self._matrix.translate(self._trans.x,self._trans.y)
+            self._matrix.rotate(self._rotate.angle)
+            self._matrix.scale(self._scale.x,self._scale.y)
         return self._matrix
 
     @property
@@ -446,12 +455,18 @@ class GObject(object):
         The inverse transformation matrix for this object
 
         This value is constructed dynamically as needed.  It should only be used
-        internally in this package
+        internally in this package.  The package itself transforms points with plain
+        floats instead, so this object is only made when it is asked for.
 
         **invariant**: Either a :class:`Matrix` or ``None``
         """
-        if not self._mtrue or self._matrix is None:
+        if not self._mtrue:
             self._build_matrix()
+        if self._invrse is None:
+            self._invrse = Matrix()
+            self._invrse.scale(1.0/self._scale.x,1.0/self._scale.y)
+            self._invrse.rotate(-self._rotate.angle)
+            self._invrse.translate(-self._trans.x,-self._trans.y)
         return self._invrse
 
 
@@ -478,6 +493,8 @@ class GObject(object):
         """
         # Set the properties.
         self._defined = False
+        self._parent = None
+        self._mtrue = False
 
         # Create the Kivy transforms for position and size
         self._trans  = Translate(0,0,0)
@@ -559,7 +576,7 @@ class GObject(object):
         if self._rotate.angle == 0.0:
             return abs(point[0]-self.x) < self.width/2.0 and abs(point[1]-self.y) < self.height/2.0
 
-        p = self.matrix.inverse()._transform(point[0],point[1])
+        p = self._to_local(point[0],point[1])
         return abs(p[0]) < self.width/2.0 and abs(p[1]) < self.height/2.0
 
     def transform(self,point):
@@ -578,11 +595,11 @@ class GObject(object):
         :rtype:  :class:`Point2`
         """
         if isinstance(point,Point2):
-            return self.inverse.transform(point)
+            p = self._to_local(point.x,point.y)
         else:
             assert is_num_tuple(point,2), "%s is not a valid point" % repr(point)
-            p = self.inverse._transform(point[0],point[2])
-            return Point2(p[0],p[1])
+            p = self._to_local(point[0],point[1])
+        return Point2(p[0],p[1])
 
     def draw(self, view):
         """
@@ -609,19 +626,77 @@ class GObject(object):
         self._cache.add(self._rotate)
         self._cache.add(self._scale)
 
-    def _build_matrix(self):
+    def _invalidate(self):
         """
-        Builds the transform matrices after a settings change.
+        Marks the transform of this object as out of date after a settings change.
+        
+        Nothing is recomputed here; the transform is rebuilt the next time it is used.
+        The change can also move the bounding box of any scene holding this object, so
+        the flag is passed up the chain of parents.  It stops at the first parent that
+        is already out of date, since every scene above that one must be too.
         """
-        self._matrix = Matrix()
-        self._matrix.translate(self._trans.x,self._trans.y)
-        self._matrix.rotate(self._rotate.angle)
-        self._matrix.scale(self._scale.x,self._scale.y)
-        self._invrse = Matrix()
-        self._invrse.scale(1.0/self._scale.x,1.0/self._scale.y)
-        self._invrse.rotate(-self._rotate.angle)
-        self._invrse.translate(-self._trans.x,-self._trans.y)
+        self._mtrue = False
+        parent = self._parent
+        while not parent is None and parent._strue:
+            parent._strue = False
+            parent = parent._parent
+    
+    def _build_matrix(self):
+        """
+        Builds the transform after a settings change.
+        
+        The transform and its inverse are stored as the six floats (a, b, c, d, e, f)
+        of the affine map (x,y) -> (a*x+b*y+c, d*x+e*y+f).  The :class:`Matrix` objects
+        in the attributes `matrix` and `inverse` are dropped, to be made again only if
+        they are asked for.
+        """
+        sx = self._scale.x
+        sy = self._scale.y
+        tx = self._trans.x
+        ty = self._trans.y
+        angle = self._rotate.angle
+        if angle == 0.0:
+            cos = 1.0
+            sin = 0.0
+        else:
+            cos = math.cos(math.radians(angle))
+            sin = math.sin(math.radians(angle))
+        self._affine = (cos*sx,-sin*sy,tx,sin*sx,cos*sy,ty)
+        self._ainverse = (cos/sx,sin/sx,-(cos*tx+sin*ty)/sx,
+                          -sin/sy,cos/sy,(sin*tx-cos*ty)/sy)
+        self._matrix = None
+        self._invrse = None
         self._mtrue = True
+    
+    def _to_parent(self,x,y):
+        """
+        Returns: the point (x,y) mapped by the transform of this object, as a tuple
+        
+        :param x: the horizontal coordinate
+        :type x:  ``int`` or ``float``
+        
+        :param y: the vertical coordinate
+        :type y:  ``int`` or ``float``
+        """
+        if not self._mtrue:
+            self._build_matrix()
+        a = self._affine
+        return (a[0]*x+a[1]*y+a[2],a[3]*x+a[4]*y+a[5])
+    
+    def _to_local(self,x,y):
+        """
+        Returns: the point (x,y) mapped by the inverse transform of this object, as a tuple
+        
+        :param x: the horizontal coordinate
+        :type x:  ``int`` or ``float``
+        
+        :param y: the vertical coordinate
+        :type y:  ``int`` or ``float``
+        """
+        if not self._mtrue:
+            self._build_matrix()
+        a = self._ainverse
+        return (a[0]*x+a[1]*y+a[2],a[3]*x+a[4]*y+a[5])
 
 
 # #mark -
@@ -659,7 +734,14 @@ class GScene(GObject):
     @children.setter
     def children(self,value):
         assert is_gobject_list(value), '%s is not a list of valid objects' % repr(value)
+        if hasattr(self,'_children'):
+            for x in self._children:
+                x._parent = None
         self._children = list(value)
+        for x in self._children:
+            x._parent = self
+        self._strue = True
+        self._invalidate_size()
         if self._defined:
             self._reset()
 
@@ -675,12 +757,9 @@ class GScene(GObject):
 
         **invariant**: Value must be an ``int`` or ``float`` > 0
         """
-        max = 0
-        for x in self.children:
-            w = x.x+x.width/2.0
-            if w > max:
-                max = w
-        return max*2
+        if not self._strue:
+            self._build_size()
+        return self._swidth
 
     @property
     def height(self):
@@ -692,12 +771,9 @@ class GScene(GObject):
 
         **invariant**: Value must be an ``int`` or ``float`` > 0
         """
-        max = 0
-        for x in self.children:
-            h = x.y+x.height/2.0
-            if h > max:
-                max = h
-        return max*2
+        if not self._strue:
+            self._build_size()
+        return self._sheight
 
 
     # BUILT-IN METHODS
@@ -718,6 +794,7 @@ class GScene(GObject):
         :type keywords:  keys are attribute names
         """
         self._defined = False
+        self._parent = None
         self.children = keywords['children'] if 'children' in keywords else []
         GObject.__init__(self,**keywords)
         self._reset()
@@ -755,6 +832,36 @@ class GScene(GObject):
 
 
     # HIDDEN METHODS
+    def _invalidate_size(self):
+        """
+        Marks the size of this scene, and of every scene holding it, as out of date.
+        """
+        scene = self
+        while not scene is None and scene._strue:
+            scene._strue = False
+            scene = scene._parent
+    
+    def _build_size(self):
+        """
+        Computes the width and height of this scene from its children.
+        
+        Moving or resizing a child marks the size as out of date (see 
+        :meth:`GObject._invalidate`), so it is only recomputed when it is used after a 
+        change.
+        """
+        width = 0
+        height = 0
+        for x in self._children:
+            w = x.x+x.width/2.0
+            if w > width:
+                width = w
+            h = x.y+x.height/2.0
+            if h > height:
+                height = h
+        self._swidth = width*2
+        self._sheight = height*2
+        self._strue = True
+    
     def _reset(self):
         """
         Resets the drawing cache
@@ -12,6 +12,7 @@ from kivy.graphics import *
 from kivy.graphics.instructions import *
 from kivy.uix.label import Label
 from kivy.uix.image import Image
+from collections import OrderedDict
 from .gobject import GObject
 from .app import GameApp
 
@@ -154,7 +155,7 @@ class GEllipse(GRectangle):
             dx = (point[0]-self.x)*(point[0]-self.x)/(rx*rx)
             dy = (point[1]-self.y)*(point[1]-self.y)/(ry*ry)
         else:
-            p = self.matrix.inverse()._transform(point[0],point[1])
+            p = self._to_local(point[0],point[1])
             dx = p[0]*p[0]/(rx*rx)
             dy = p[1]*p[1]/(ry*ry)
         
@@ -296,7 +297,18 @@ class GLabel(GRectangle):
     to the font by filename, including the .ttf. If you give no name, it will use the 
     default Kivy font.  The `bold` attribute only works for the default Kivy font; for 
     other fonts you will need the .ttf file for the bold version of that font.  See the
-    provided `ComicSans.ttf` and `ComicSansBold.ttf` for an example."""
+    provided `ComicSans.ttf` and `ComicSansBold.ttf` for an example.
+    
+    Rendering text is slow, so setting `text` to the value it already has does nothing,
+    and every label shares a small cache of the most recently rendered textures, keyed 
+    by the text and every option that changes how it is drawn.  A label whose text 
+    goes back to a recent value, such as a score flipping between two numbers, reuses
+    the texture instead of rendering it again."""
+    
+    # Class attribute for the rendered text, oldest first
+    TEXT_CACHE = OrderedDict()
+    # The number of rendered textures to keep in TEXT_CACHE
+    TEXT_CACHE_SIZE = 64
     
     # MUTABLE PROPERTIES
     @property
@@ -312,7 +324,7 @@ class GLabel(GRectangle):
         assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         self._fsize = value
         self._label.font_size = value
-        self._label.texture_update()
+        self._render()
     
     @property
     def font_name(self):
@@ -327,7 +339,7 @@ class GLabel(GRectangle):
         from .app import GameApp
         assert GameApp.is_font(value), 'value %s is not a font name' % repr(value)
         self._label.font_name = value
-        self._label.texture_update()
+        self._render()
     
     @property
     def bold(self):
@@ -345,7 +357,7 @@ class GLabel(GRectangle):
     def bold(self,value):
         assert type(value) == bool, repr(value)+' is not a bool'
         self._label.bold = value
-        self._label.texture_update()
+        self._render()
 
     @property
     def text(self):
@@ -362,8 +374,10 @@ class GLabel(GRectangle):
     @text.setter
     def text(self,value):
         assert type(value) == str, 'value %s is not a string' % repr(value)
+        if value == self._label.text:
+            return
         self._label.text = value
-        self._label.texture_update()
+        self._render()
     
     @property
     def halign(self):
@@ -427,7 +441,7 @@ class GLabel(GRectangle):
     def x(self,value):
         assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         self._trans.x = float(value)
-        self._mtrue = False
+        self._invalidate()
         self._hanchor = 'center'
         self._ha = value
     
@@ -443,7 +457,7 @@ class GLabel(GRectangle):
     def y(self,value):
         assert type(value) in [int,float], 'value %s is not a number' % repr(value)
         self._trans.y = float(value)
-        self._mtrue = False
+        self._invalidate()
         self._vanchor = 'center'
         self._hv = value
     
@@ -465,10 +479,10 @@ class GLabel(GRectangle):
         if self._rotate.angle == 0.0:
             return self.x-self.width/2.0
         
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[0]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[0]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[0]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[0]
+        p0 = self._to_parent(self.x-self.width/2.0, self.y-self.height/2.0)[0]
+        p1 = self._to_parent(self.x+self.width/2.0, self.y-self.height/2.0)[0]
+        p2 = self._to_parent(self.x+self.width/2.0, self.y+self.height/2.0)[0]
+        p3 = self._to_parent(self.x-self.width/2.0, self.y+self.height/2.0)[0]
         return min(p0,p1,p2,p3)
     
     @left.setter
@@ -497,10 +511,10 @@ class GLabel(GRectangle):
         if self._rotate.angle == 0.0:
             return self.x+self.width/2.0
         
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[0]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[0]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[0]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[0]
+        p0 = self._to_parent(self.x-self.width/2.0, self.y-self.height/2.0)[0]
+        p1 = self._to_parent(self.x+self.width/2.0, self.y-self.height/2.0)[0]
+        p2 = self._to_parent(self.x+self.width/2.0, self.y+self.height/2.0)[0]
+        p3 = self._to_parent(self.x-self.width/2.0, self.y+self.height/2.0)[0]
         return max(p0,p1,p2,p3)
     
     @right.setter
@@ -529,10 +543,10 @@ class GLabel(GRectangle):
         if self._rotate.angle == 0.0:
             return self.y+self.height/2.0
         
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[1]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[1]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[1]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[1]
+        p0 = self._to_parent(self.x-self.width/2.0, self.y-self.height/2.0)[1]
+        p1 = self._to_parent(self.x+self.width/2.0, self.y-self.height/2.0)[1]
+        p2 = self._to_parent(self.x+self.width/2.0, self.y+self.height/2.0)[1]
+        p3 = self._to_parent(self.x-self.width/2.0, self.y+self.height/2.0)[1]
         return max(p0,p1,p2,p3)
     
     @top.setter
@@ -560,10 +574,10 @@ class GLabel(GRectangle):
         if self._rotate.angle == 0.0:
             return self.y-self.height/2.0
         
-        p0 = self.matrix._transform(self.x-self.width/2.0, self.y-self.height/2.0)[1]
-        p1 = self.matrix._transform(self.x+self.width/2.0, self.y-self.height/2.0)[1]
-        p2 = self.matrix._transform(self.x+self.width/2.0, self.y+self.height/2.0)[1]
-        p3 = self.matrix._transform(self.x-self.width/2.0, self.y+self.height/2.0)[1]
+        p0 = self._to_parent(self.x-self.width/2.0, self.y-self.height/2.0)[1]
+        p1 = self._to_parent(self.x+self.width/2.0, self.y-self.height/2.0)[1]
+        p2 = self._to_parent(self.x+self.width/2.0, self.y+self.height/2.0)[1]
+        p3 = self._to_parent(self.x-self.width/2.0, self.y+self.height/2.0)[1]
         return min(p0,p1,p2,p3)
     
     
@@ -627,6 +641,67 @@ class GLabel(GRectangle):
                 % (s,repr(self.text),repr(self.x),repr(self.y),repr(self.angle))
     
     # HIDDEN METHODS
+    def _render(self):
+        """
+        Updates the label texture after a change to the text or font.
+        
+        The texture comes from TEXT_CACHE if the same text was rendered recently with
+        the same options (see :meth:`_texture_key`); otherwise the text is rendered and 
+        the result added to the cache, dropping the least recently used texture once 
+        the cache is full.
+        """
+        label = self._label
+        key = self._texture_key(label)
+        cache = GLabel.TEXT_CACHE
+        if key in cache:
+            texture = cache[key]
+            cache.move_to_end(key)
+            label.texture = texture
+            label.texture_size = list(texture.size)
+        else:
+            label.texture_update()
+            texture = label.texture
+            if not texture is None:
+                cache[key] = texture
+                if len(cache) > GLabel.TEXT_CACHE_SIZE:
+                    cache.popitem(last=False)
+                # The core label draws into its old texture if the size matches
+                label._label.texture = None
+        # The text change also scheduled a render for the next frame
+        label._trigger_texture.cancel()
+    
+    @classmethod
+    def _texture_key(cls,label):
+        """
+        Returns: The TEXT_CACHE key for the texture of a Kivy label
+        
+        The key holds the value of every label property that Kivy renders the texture
+        again for (listed in ``Label._font_properties``): the text and font, but also 
+        the alignment, wrap width (``text_size``), padding, color and so on.  Two labels
+        only share a texture if all of these match.
+        
+        :param label: The Kivy label
+        :type label:  ``Label``
+        """
+        return tuple(cls._hashable(getattr(label,name)) for name in label._font_properties)
+    
+    @classmethod
+    def _hashable(cls,value):
+        """
+        Returns: A hashable copy of a label property value
+        
+        Lists become tuples and dictionaries become sorted tuples of pairs, all the way
+        down.
+        
+        :param value: The property value
+        :type value:  any
+        """
+        if isinstance(value,dict):
+            return tuple(sorted((k,cls._hashable(v)) for (k,v) in value.items()))
+        if isinstance(value,(list,tuple)):
+            return tuple(cls._hashable(v) for v in value)
+        return value
+    
     def _callback(self,instance=None,value=None):
         """
         A workaround to deal with parameter requirements for callbacks
@@ -691,3 +766,225 @@ class GLabel(GRectangle):
             self._cache.add(line)
         
         self._cache.add(PopMatrix())
+
+
+# #mark -
+class GBitmapLabel(GObject):
+    """
+    A class representing a one-line text label drawn from a glyph atlas
+    
+    A :class:`GLabel` renders its whole string with the font every time the text 
+    changes.  This label instead renders every printable ASCII character of its font 
+    once, into a texture shared by all labels with the same font, size and boldness.  
+    The text is then a row of quads in a single ``Mesh``, and changing the text only
+    rewrites the vertices of that mesh.  This makes it a good fit for counters, like a 
+    score, that change often.
+    
+    The label supports the same `text`, `font_name`, `font_size`, `bold` and 
+    `linecolor` keywords as :class:`GLabel`, and the text is centered on (x,y).  
+    Unlike a `GLabel`, the font attributes cannot change after the label is made, the 
+    text is a single line, and characters outside of printable ASCII are drawn as 
+    '?'.  The `width` and `height` are the size of the text, and cannot be set.
+    """
+    
+    # Class attribute for the glyph atlases, keyed by (font_name, font_size, bold)
+    GLYPH_CACHE = {}
+    # The characters rasterized into each atlas
+    GLYPHS = ''.join([chr(code) for code in range(32,127)])
+    
+    # MUTABLE PROPERTIES
+    @property
+    def text(self):
+        """
+        The text for this label.
+        
+        **Invariant**: Must be a string"""
+        return self._text
+    
+    @text.setter
+    def text(self,value):
+        assert type(value) == str, 'value %s is not a string' % repr(value)
+        if value == self._text:
+            return
+        self._text = value
+        if self._defined:
+            self._layout()
+    
+    
+    # IMMUTABLE PROPERTIES
+    @property
+    def font_name(self):
+        """
+        The file name for the .ttf file used as a font, or None for the default font
+        
+        **Invariant**: Must be None or a string referring to a .ttf file in folder Fonts"""
+        return self._fname
+    
+    @property
+    def font_size(self):
+        """
+        The size of the text font in points.
+        
+        **Invariant**: Must be a positive number (int or float)"""
+        return self._fsize
+    
+    @property
+    def bold(self):
+        """
+        A boolean indicating whether or not the text is bold.
+        
+        **Invariant**: Must be a boolean"""
+        return self._bold
+    
+    @property
+    def width(self):
+        """
+        The horizontal width of the text.
+        
+        **invariant**: Value must be an ``int`` or ``float`` >= 0
+        """
+        return self._width
+    
+    @property
+    def height(self):
+        """
+        The vertical height of the text.
+        
+        **invariant**: Value must be an ``int`` or ``float`` > 0
+        """
+        return self._height
+    
+    
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new bitmap text label.
+        
+        To use the constructor for this class, you should provide it with a list of 
+        keyword arguments that initialize various attributes.  For example, to create a 
+        label containing a score, use the constructor call::
+            
+            GBitmapLabel(text='Score: 0',font_name='RetroGame.ttf',font_size=25)
+        
+        This class supports the same keywords as :class:`GObject`, though `width` and 
+        `height` are unused, as well as `text`, `font_name`, `font_size` and `bold`.
+        """
+        self._defined = False
+        self._text = keywords['text'] if 'text' in keywords else ''
+        assert type(self._text) == str, 'value %s is not a string' % repr(self._text)
+        self._fname = keywords['font_name'] if 'font_name' in keywords else None
+        assert self._fname is None or GameApp.is_font(self._fname), 'value %s is not a font name' % repr(self._fname)
+        self._fsize = keywords['font_size'] if 'font_size' in keywords else 15
+        assert type(self._fsize) in [int,float] and self._fsize > 0, 'value %s is not a valid font size' % repr(self._fsize)
+        self._bold = keywords['bold'] if 'bold' in keywords else False
+        assert type(self._bold) == bool, repr(self._bold)+' is not a bool'
+        
+        self._atlas = GBitmapLabel._load_glyphs(self._fname,self._fsize,self._bold)
+        self._width = 0.0
+        self._height = float(self._atlas[2])
+        self._mesh = Mesh(mode='triangles',texture=self._atlas[0])
+        
+        GObject.__init__(self,**keywords)
+        if not self.linecolor:
+            self.linecolor = (0,0,0,1)
+        self._layout()
+        self._reset()
+        self._defined = True
+    
+    def __str__(self):
+        """
+        :return: A readable string representation of this object.
+        :rtype:  ``str``
+        """
+        if self.name is None:
+            s = '['
+        else:
+            s = '[name=%s,' % self.name
+        return '%s,text=%s,center=(%s,%s),angle=%s]' \
+                % (s,repr(self.text),repr(self.x),repr(self.y),repr(self.angle))
+    
+    
+    # HIDDEN METHODS
+    @classmethod
+    def _load_glyphs(cls,font_name,font_size,bold):
+        """
+        Returns: the glyph atlas for the given font as (texture, glyphs, height)
+        
+        The glyphs are a dictionary from each character in GLYPHS to a pair of its 
+        texture coordinates and its width.  The atlas is made the first time a font is 
+        asked for, by rendering GLYPHS as one line and cutting it at the width of each 
+        prefix, and then kept in GLYPH_CACHE.
+        
+        :param font_name: The file name for the .ttf file, or None for the default font
+        :type font_name:  ``str`` or None
+        
+        :param font_size: The size of the font in points
+        :type font_size:  ``int`` or ``float`` > 0
+        
+        :param bold: Whether the font is bold
+        :type bold:  ``bool``
+        """
+        key = (font_name,font_size,bold)
+        if key in cls.GLYPH_CACHE:
+            return cls.GLYPH_CACHE[key]
+        
+        from kivy.core.text import Label as CoreLabel
+        options = {'text':cls.GLYPHS,'font_size':font_size,'bold':bold}
+        if not font_name is None:
+            options['font_name'] = font_name
+        core = CoreLabel(**options)
+        core.refresh()
+        texture = core.texture
+        
+        glyphs = {}
+        left = 0
+        for pos in range(len(cls.GLYPHS)):
+            right = core.get_extents(cls.GLYPHS[:pos+1])[0]
+            region = texture.get_region(left,0,right-left,texture.height)
+            glyphs[cls.GLYPHS[pos]] = (region.tex_coords,right-left)
+            left = right
+        
+        atlas = (texture,glyphs,texture.height)
+        cls.GLYPH_CACHE[key] = atlas
+        return atlas
+    
+    def _layout(self):
+        """
+        Rewrites the mesh vertices for the current text.
+        
+        The indices only change when the length of the text does.
+        """
+        glyphs = self._atlas[1]
+        missing = glyphs['?']
+        width = 0
+        for c in self._text:
+            width += glyphs.get(c,missing)[1]
+        
+        x = -width/2.0
+        bottom = -self._height/2.0
+        top = self._height/2.0
+        vertices = []
+        for c in self._text:
+            (uv, advance) = glyphs.get(c,missing)
+            right = x+advance
+            vertices.extend((x,bottom,uv[0],uv[1],right,bottom,uv[2],uv[3],
+                             right,top,uv[4],uv[5],x,top,uv[6],uv[7]))
+            x = right
+        
+        if len(self._mesh.indices) != 6*len(self._text):
+            indices = []
+            for k in range(len(self._text)):
+                v = 4*k
+                indices.extend((v,v+1,v+2,v+2,v+3,v))
+            self._mesh.indices = indices
+        self._mesh.vertices = vertices
+        self._width = float(width)
+    
+    def _reset(self):
+        """
+        Resets the drawing cache.
+        """
+        GObject._reset(self)
+        self._cache.add(self._linecolor)
+        self._cache.add(self._mesh)
+        self._cache.add(PopMatrix())
@@ -130,18 +130,9 @@ class GSprite(GRectangle):
         x = -self.width/2.0
         y = -self.height/2.0
         
-        texture = GameApp.load_texture(self.source)
-        if texture:
-            width  = texture.width/self._format[1]
-            height = texture.height/self._format[0]
-            
-            ty = 0
-            for row in range(self._format[0]):
-                tx = 0
-                for col in range(self._format[1]):
-                    self._images[row*self._format[1]+col] = texture.get_region(int(tx),texture.height-int(ty)-int(height),int(width),int(height))
-                    tx += width
-                ty += width
+        frames = GameApp.load_frames(self.source,self._format)
+        if frames:
+            self._images = frames
         else:
             print('Failed to load',repr(self.source))
         
@@ -160,3 +151,184 @@ class GSprite(GRectangle):
         
         self._cache.add(PopMatrix())
 
+
+# #mark -
+class GSpriteBatch(GObject):
+    """
+    A class representing many copies of one filmstrip, drawn all at once.
+    
+    Every :class:`GSprite` has its own chain of Kivy instructions, so drawing a large
+    group of sprites costs several instructions per sprite each frame.  A sprite batch
+    instead puts every copy of the filmstrip into a single ``Mesh``.  Each copy is a
+    quad in one vertex buffer, which is rebuilt in place whenever a copy moves or
+    changes frame.  However many sprites there are, the view only sees one instruction.
+    
+    The copies all share the attributes ``source``, ``width``, ``height`` and the frame
+    grid of the batch.  They are numbered 0..size-1, and are placed with :meth:`place`
+    and removed from the screen with :meth:`hide`.  Copies start out hidden.  The
+    coordinates of a copy are relative to the point (x,y) of the batch, as with the
+    children of a :class:`GScene`.
+    """
+    
+    # IMMUTABLE PROPERTIES
+    @property
+    def source(self):
+        """
+        The source file for the filmstrip.
+        
+        **invariant**. Value is a string refering to a valid file.
+        """
+        return self._source
+    
+    @property
+    def count(self):
+        """
+        The number of frames in the filmstrip
+        
+        **invariant**. Value is an int > 0.
+        """
+        return self._format[0]*self._format[1]
+    
+    @property
+    def size(self):
+        """
+        The number of sprites in this batch
+        
+        **invariant**. Value is an int > 0.
+        """
+        return self._size
+    
+    
+    # BUILT-IN METHODS
+    def __init__(self,**keywords):
+        """
+        Creates a new sprite batch
+        
+        To use the constructor for this class, you should provide it with a list of 
+        keyword arguments that initialize various attributes. For example, to make room
+        for 24 copies of the filmstrip ``alien-strip1.png``, which has 3 rows and 2 
+        columns, use the constructor::
+            
+            GSpriteBatch(width=33,height=33,source='alien-strip1.png',format=(3,2),size=24)
+        
+        The keyword ``size`` is the number of sprites in the batch.  The keywords 
+        ``width`` and ``height`` are the size of each sprite.  See the documentation of
+        :class:`GSprite` and :class:`GObject` for the other supported keywords.
+        
+        :param keywords: dictionary of keyword arguments 
+        :type keywords:  keys are attribute names
+        """
+        self._defined = False
+        source = keywords['source'] if 'source' in keywords else None
+        assert GameApp.is_image(source), '%s is not an image file' % repr(source)
+        self._source = source
+        self._setFormat(keywords['format'] if 'format' in keywords else (1,1))
+        size = keywords['size'] if 'size' in keywords else 1
+        assert type(size) == int and size > 0, '%s is not a valid size' % repr(size)
+        self._size = size
+        self._coords = [None]*self.count
+        self._vertices = [0.0]*(16*size)
+        self._mesh = None
+        self._dirty = False
+        GObject.__init__(self,**keywords)
+        self._reset()
+        self._defined = True
+    
+    
+    # PUBLIC METHODS
+    def place(self,index,x,y,frame):
+        """
+        Shows sprite index centered at (x,y), displaying the given frame.
+        
+        :param index: the sprite to place
+        :type index:  ``int`` 0..size-1
+        
+        :param x: the horizontal coordinate of the sprite center
+        :type x:  ``int`` or ``float``
+        
+        :param y: the vertical coordinate of the sprite center
+        :type y:  ``int`` or ``float``
+        
+        :param frame: the animation frame to show
+        :type frame:  ``int`` 0..count-1
+        """
+        left = x-self.width/2.0
+        bottom = y-self.height/2.0
+        right = left+self.width
+        top = bottom+self.height
+        uv = self._coords[frame]
+        pos = 16*index
+        self._vertices[pos:pos+16] = [left,bottom,uv[0],uv[1],right,bottom,uv[2],uv[3],
+                                      right,top,uv[4],uv[5],left,top,uv[6],uv[7]]
+        self._dirty = True
+    
+    def hide(self,index):
+        """
+        Removes sprite index from the screen.
+        
+        The sprite collapses to a quad with no area, so the vertex buffer keeps the
+        same layout.
+        
+        :param index: the sprite to hide
+        :type index:  ``int`` 0..size-1
+        """
+        pos = 16*index
+        self._vertices[pos:pos+16] = [0.0]*16
+        self._dirty = True
+    
+    def draw(self, view):
+        """
+        Draws this batch in the provide view.
+        
+        The vertex buffer is only sent to the mesh if a sprite changed since the last
+        time the batch was drawn.
+        
+        :param view: view to draw to
+        :type view:  :class:`GView`
+        """
+        if self._dirty and self._mesh:
+            self._mesh.vertices = self._vertices
+            self._dirty = False
+        GObject.draw(self,view)
+    
+    
+    # HIDDEN METHODS
+    def _setFormat(self,value):
+        """
+        Sets the grid size of this filmstrip.
+        
+        Parameter value: The filmstrip grid size
+        Precondition: value is a 2-element tuple of ints > 0
+        """
+        assert type(value) == tuple and len(value) == 2, '%s does is not a tuple pair' % repr(value)
+        assert type(value[0]) == int and type(value[1]) == int, '%s does not have int values' % repr(value)
+        assert value[0] > 0 and value[1] > 0, '%s does not have valid values' % repr(value)
+        self._format = value
+    
+    def _reset(self):
+        """
+        Resets the drawing cache.
+        """
+        GObject._reset(self)
+        frames = GameApp.load_frames(self.source,self._format)
+        self._mesh = None
+        if frames:
+            texture = GameApp.load_texture(self.source)
+            self._coords = [frame.tex_coords for frame in frames]
+            
+            indices = []
+            for k in range(self._size):
+                v = 4*k
+                indices.extend((v,v+1,v+2,v+2,v+3,v))
+            self._mesh = Mesh(vertices=self._vertices,indices=indices,mode='triangles',texture=texture)
+            self._dirty = False
+        else:
+            print('Failed to load',repr(self.source))
+        
+        if not self._fillcolor is None:
+            self._cache.add(self._fillcolor)
+        else:
+            self._cache.add(Color(1,1,1))
+        if self._mesh:
+            self._cache.add(self._mesh)
+        self._cache.add(PopMatrix())
@@ -319,12 +319,44 @@ class GView(FloatLayout):
     :class:`GObject` instances to the :meth:`draw` method.  You must do this every
     animation frame, as the game is constantly clearing the window.
 
+    If :attr:`retained` is True, the view keeps the graphics from the last frame
+    instead of clearing them.  You still draw every object each frame, but the view
+    only compares the new draw order with the old one, and changes the window just
+    where an object appeared, disappeared or was rebuilt.  The cost of a frame then
+    depends on how much changed rather than on how many objects there are.
+
     **You should never construct an object of this class**.  Creating a new instance
     of this class will not properly display it on the screen.  Instead, you should
     only use the one provided in the `view` attribute of :class:`GameApp`.
     See the documentation of that class for more information.
     """
 
+    # MUTABLE PROPERTIES
+    @property
+    def retained(self):
+        """
+        Whether the view keeps its graphics from one frame to the next.
+
+        When this is False (the default), the view is emptied at the start of every
+        animation frame and refilled by the calls to :meth:`draw`.  When it is True,
+        the view only adds and removes the graphics that changed since the previous
+        frame.  Either way the picture on the screen is the same.
+
+        **Invariant**: Must be a bool
+        """
+        return self._retained
+
+    @retained.setter
+    def retained(self,value):
+        assert type(value) == bool, 'value %s is not a bool' % repr(value)
+        if value != self._retained:
+            self._frame.clear()
+            self._contents.clear()
+            self._order = []
+            self._drawn = []
+        self._retained = value
+
+
     # BUILT-IN METHODS
     def __init__(self):
         """
@@ -341,6 +373,9 @@ class GView(FloatLayout):
         self.bind(size=self._reset)
         self._reset()
         self._contents = set()
+        self._retained = False
+        self._order = []
+        self._drawn = []
 
 
     # PUBLIC METHODS
@@ -355,20 +390,61 @@ class GView(FloatLayout):
         :type cmd:  A Kivy graphics command
         """
         if not cmd in self._contents:
-            self._frame.add(cmd)
             self._contents.add(cmd)
+            if self._retained:
+                self._drawn.append(cmd)
+            else:
+                self._frame.add(cmd)
 
     def clear(self):
         """
         Clears the contents of the view.
 
         This method is called for you automatically at the start of the animation
-        frame.  That way, you are not drawing images on top of one another.
+        frame.  That way, you are not drawing images on top of one another.  If
+        :attr:`retained` is True, the graphics stay in the window until the end of
+        the frame, when they are compared with what was drawn.
         """
-        self._frame.clear()
         self._contents.clear()
+        if self._retained:
+            self._drawn = []
+        else:
+            self._frame.clear()
 
     # HIDDEN METHODS
+    def _commit(self):
+        """
+        Updates the window to match the graphics drawn this frame.
+
+        This method is called for you automatically at the end of the animation frame,
+        and does nothing unless :attr:`retained` is True.  The commands drawn this frame
+        are compared with the ones from the last frame.  Only the run of commands
+        between the longest common prefix and the longest common suffix is replaced,
+        so an unchanged frame costs a single list comparison.
+        """
+        if not self._retained:
+            return
+        old = self._order
+        new = self._drawn
+        if old == new:
+            return
+
+        size = min(len(old),len(new))
+        start = 0
+        while start < size and old[start] is new[start]:
+            start += 1
+        end = 0
+        while end < size-start and old[-1-end] is new[-1-end]:
+            end += 1
+
+        for cmd in old[start:len(old)-end]:
+            self._frame.remove(cmd)
+        pos = start
+        for cmd in new[start:len(new)-end]:
+            self._frame.insert(pos,cmd)
+            pos += 1
+        self._order = new
+
     def _reset(self,obj=None,value=None):
         """
         Resets the view canvas in response to a resizing event
@@ -118,13 +118,34 @@ class SoundLibrary(object):
     To play the sound, we access it as follows::
         
         soundlib['soundname'].play()
+    
+    Sounds come from :meth:`GameApp.load_sound`, so a file is only decoded once no 
+    matter how many libraries use it, and assigning a key the file it already has 
+    does nothing.  The library keeps its sounds alive, so they are not loaded again
+    after the game releases them from the sound cache.  The library returned by 
+    :meth:`shared` lasts as long as the program, and is the one to use for sounds
+    that are wanted again and again, such as the effects of every wave.
     """
+    # Class attribute for the library returned by shared
+    SHARED = None
+    
+    @classmethod
+    def shared(cls):
+        """
+        Returns: The sound library shared by the whole program
+        
+        The library is created, empty, the first time this method is called.
+        """
+        if cls.SHARED is None:
+            cls.SHARED = cls()
+        return cls.SHARED
     
     def __init__(self):
         """
         Creates a new, empty sound library.
         """
         self._data = {}
+        self._files = {}
     
     def __len__(self):
         """
@@ -155,7 +176,10 @@ class SoundLibrary(object):
         :param filename: The name of the file containing the sound source
         :type filename:  ``str``
         """
-        self._data[key] = Sound(filename)
+        if self._files.get(key) == filename:
+            return
+        self._data[key] = GameApp.load_sound(filename)
+        self._files[key] = filename
     
     def __delitem__(self, key):
         """
@@ -165,6 +189,7 @@ class SoundLibrary(object):
         :type key:  ``str``
         """
         del self._data[key]
+        del self._files[key]
     
     def __iter__(self):
         """
@@ -173,9 +198,345 @@ class SoundLibrary(object):
         """
         return iter(self._data.keys())
     
+    def uses(self,filename):
+        """
+        :return: True if a sound in this library was loaded from the given file.
+        :rtype:  ``bool``
+        
+        :param filename: The name of the file containing the sound source
+        :type filename:  ``str``
+        """
+        return filename in self._files.values()
+    
     def keys(self):
         """
         :return: The keys for this sound dictionary.
         :rtype:  ``iterable``
         """
         return self._data.keys()
+
+
+# #mark -
+class Bus(object):
+    """
+    A class representing a volume control shared by a group of sounds.
+    
+    A bus has its own :attr:`volume`, and may feed into a parent bus.  The volume
+    a sound on the bus is played at is its :attr:`gain`, which is the volume of the
+    bus times the gain of its parent.  So turning down a bus turns down every sound 
+    on it, and on every bus below it, without touching the sounds themselves.
+    """
+    
+    # MUTABLE PROPERTIES
+    @property
+    def volume(self):
+        """
+        The volume of this bus, before the parent bus is applied.
+        
+        1 means full volume, 0 means mute.  The default value is 1.
+        
+        **Invariant**: Must float in the range 0..1.
+        """
+        return self._volume
+    
+    @volume.setter
+    def volume(self,value):
+        assert type(value) in [int, float] and value >= 0 and value <= 1, \
+            'value %s is not a valid volume' % repr(value)
+        self._volume = value
+    
+    # IMMUTABLE PROPERTIES
+    @property
+    def name(self):
+        """
+        The name of this bus.
+        
+        **Immutable**: This value cannot be changed after the bus is created.
+        
+        **Invariant**: Must be a string.
+        """
+        return self._name
+    
+    @property
+    def parent(self):
+        """
+        The bus this bus feeds into, or None.
+        
+        **Immutable**: This value cannot be changed after the bus is created.
+        
+        **Invariant**: Must be a :class:`Bus` or None.
+        """
+        return self._parent
+    
+    @property
+    def gain(self):
+        """
+        The volume that sounds on this bus are played at.
+        
+        This is the volume of this bus times the gain of its parent.
+        
+        **Immutable**: You should change :attr:`volume` instead.
+        
+        **Invariant**: Must float in the range 0..1.
+        """
+        if self._parent is None:
+            return self._volume
+        return self._volume*self._parent.gain
+    
+    def __init__(self,name,parent=None,volume=1):
+        """
+        Creates a new bus.
+        
+        :param name: The name of the bus
+        :type name:  ``str``
+        
+        :param parent: The bus this bus feeds into, or None
+        :type parent:  :class:`Bus` or None
+        
+        :param volume: The volume of the bus
+        :type volume:  ``float`` in 0..1
+        """
+        assert type(name) == str, '%s is not a valid bus name' % repr(name)
+        assert parent is None or isinstance(parent,Bus), '%s is not a bus' % repr(parent)
+        self._name = name
+        self._parent = parent
+        self.volume = volume
+
+
+# #mark -
+class Mixer(object):
+    """
+    A class that plays the sounds of a :class:`SoundLibrary` on pools of voices.
+    
+    A :class:`Sound` cannot be played again until it finishes, so playing the same 
+    sound twice at once cuts off the first one.  A mixer gives each sound a fixed
+    pool of voices, each of them its own copy of the sound, so that up to that many
+    can play at the same time.  The copies come from :meth:`GameApp.load_voices`,
+    which decodes them in the background, and are shared by every mixer.  The size of the pool is the cap on how many copies 
+    of a sound can play at once.  When every voice of a sound is busy, the one that
+    started first is stopped and used again.
+    
+    Sounds are not started right away.  Calls to :meth:`play` are collected, and the
+    next call to :meth:`update` starts each sound asked for once, however many times
+    it was asked for.  Call :meth:`update` once per game tick, so that ten aliens 
+    destroyed in the same tick make one sound, not ten.
+    
+    The volume is set by three :class:`Bus` objects: :attr:`master`, and the
+    :attr:`music` and :attr:`sfx` buses that feed into it.  Every voice is played 
+    at the gain of the sfx bus, which it takes when it starts.  The music is the one
+    sound given to :meth:`play_music`, and follows the gain of the music bus.  As 
+    the buses belong to the mixer, the mixer from :meth:`shared` keeps the volume 
+    for as long as the program runs.
+    """
+    # Class attribute for the mixer returned by shared
+    SHARED = None
+    
+    @classmethod
+    def shared(cls):
+        """
+        Returns: The mixer shared by the whole program
+        
+        The mixer is created the first time this method is called, and plays the
+        sounds of :meth:`SoundLibrary.shared`.
+        """
+        if cls.SHARED is None:
+            cls.SHARED = cls(SoundLibrary.shared())
+        return cls.SHARED
+    
+    @property
+    def library(self):
+        """
+        The sound library whose sounds this mixer plays.
+        
+        **Immutable**: This value cannot be changed after the mixer is created.
+        
+        **Invariant**: Must be a :class:`SoundLibrary`.
+        """
+        return self._library
+    
+    @property
+    def voices(self):
+        """
+        The number of voices given to a sound unless :meth:`load` says otherwise.
+        
+        **Immutable**: This value cannot be changed after the mixer is created.
+        
+        **Invariant**: Must be an int > 0.
+        """
+        return self._voices
+    
+    @property
+    def master(self):
+        """
+        The bus that every sound of this mixer goes through.
+        
+        **Immutable**: This value cannot be changed, but its volume can.
+        
+        **Invariant**: Must be a :class:`Bus`.
+        """
+        return self._master
+    
+    @property
+    def music(self):
+        """
+        The bus for the music, which feeds into :attr:`master`.
+        
+        **Immutable**: This value cannot be changed, but its volume can.
+        
+        **Invariant**: Must be a :class:`Bus`.
+        """
+        return self._music
+    
+    @property
+    def sfx(self):
+        """
+        The bus for the sounds in the library, which feeds into :attr:`master`.
+        
+        **Immutable**: This value cannot be changed, but its volume can.
+        
+        **Invariant**: Must be a :class:`Bus`.
+        """
+        return self._sfx
+    
+    def __init__(self,library,voices=3):
+        """
+        Creates a new mixer for the sounds of a library.
+        
+        :param library: The library with the sounds to play
+        :type library:  :class:`SoundLibrary`
+        
+        :param voices: The number of voices for each sound
+        :type voices:  ``int`` > 0
+        """
+        assert isinstance(library,SoundLibrary), '%s is not a sound library' % repr(library)
+        assert type(voices) == int and voices > 0, '%s is not a valid voice count' % repr(voices)
+        self._library = library
+        self._voices  = voices
+        self._pools   = {}
+        self._sizes   = {}
+        self._started = {}
+        self._queued  = []
+        self._clock   = 0
+        self._master  = Bus('master')
+        self._music   = Bus('music',self._master)
+        self._sfx     = Bus('sfx',self._master)
+        self._track   = None
+    
+    def load(self,key,voices=None):
+        """
+        Starts loading the pool of voices for the sound with the given key.
+        
+        The extra copies of the sound are decoded on a background thread by 
+        :meth:`GameApp.load_voices`, so this method never holds up a frame.  Until
+        they arrive, the pool only has the voices loaded so far; the sound in the 
+        library is always the first one.  Call this method ahead of time, so that the
+        copies are ready when the sound is first played.  A sound that is played 
+        without being loaded gets :attr:`voices` voices.
+        
+        :param key: The key identifying a sound in the library
+        :type key:  ``str``
+        
+        :param voices: The number of voices, or None for :attr:`voices`
+        :type voices:  ``int`` > 0 or None
+        """
+        if voices is None:
+            voices = self._voices
+        assert type(voices) == int and voices > 0, '%s is not a valid voice count' % repr(voices)
+        self._sizes[key] = voices
+        GameApp.load_voices(self._library[key].source,voices-1)
+        self._refresh(key)
+    
+    def play(self,key):
+        """
+        Asks for the sound with the given key to be played at the next :meth:`update`.
+        
+        Asking for a sound that is already asked for this tick does nothing.
+        
+        :param key: The key identifying a sound in the library
+        :type key:  ``str``
+        """
+        if not key in self._queued:
+            self._queued.append(key)
+    
+    def update(self):
+        """
+        Starts every sound asked for since the last update, once each.
+        
+        Each sound starts on a voice that is not playing.  If all of its voices are
+        playing, the one that started first is stopped and started again.  The music
+        is also set to the gain of the music bus, if that has changed.
+        """
+        if self._track is not None and self._track.volume != self._music.gain:
+            self._track.volume = self._music.gain
+        gain = self._sfx.gain
+        for key in self._queued:
+            if not key in self._sizes:
+                self.load(key)
+            pool = self._pools[key]
+            if pool[0] is not self._library[key] or len(pool) < self._sizes[key]:
+                pool = self._refresh(key)
+            started = self._started[key]
+            pick = 0
+            for pos in range(len(pool)):
+                if not pool[pos].playing:
+                    pick = pos
+                    break
+                if started[pos] < started[pick]:
+                    pick = pos
+            voice = pool[pick]
+            if voice.playing:
+                voice.stop()
+            if voice.volume != gain:
+                voice.volume = gain
+            self._clock += 1
+            started[pick] = self._clock
+            voice.play()
+        self._queued = []
+    
+    def play_music(self,sound,loop=True):
+        """
+        Plays the given sound as the music, at the gain of the music bus.
+        
+        :param sound: The music to play
+        :type sound:  :class:`Sound`
+        
+        :param loop: Whether or not to loop the music
+        :type loop:  ``bool``
+        """
+        assert isinstance(sound,Sound), '%s is not a sound' % repr(sound)
+        self._track = sound
+        sound.volume = self._music.gain
+        sound.play(loop)
+    
+    def _refresh(self,key):
+        """
+        Returns the pool of voices for the given key, after adding the voices that
+        have arrived since it was made.
+        
+        If the library has a different sound for the key than the pool, the pool is 
+        made again from scratch.
+        
+        :param key: The key identifying a sound in the library
+        :type key:  ``str``
+        """
+        sound = self._library[key]
+        copies = GameApp.voices(sound.source)[:self._sizes[key]-1]
+        old = self._pools.get(key)
+        started = self._started.get(key,[])
+        if old is None or old[0] is not sound:
+            started = []
+        pool = [sound]+list(copies)
+        self._pools[key] = pool
+        self._started[key] = started+[0]*(len(pool)-len(started))
+        return pool
+    
+    def stop(self):
+        """
+        Stops every voice, and forgets the sounds asked for since the last update.
+        
+        The music keeps playing.
+        """
+        for key in self._pools:
+            for voice in self._pools[key]:
+                voice.stop()
+        self._queued = []
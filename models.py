@@ -99,30 +99,6 @@ class Ship(GImage):
         """
         super().__init__(x=x,y=y,width=w,height=h,source=source)
 
-    # METHODS TO MOVE THE SHIP AND CHECK FOR COLLISIONS
-    def collides(self,bolt):
-        """
-        Returns: True if the bolt was fired by the player and collides with this
-        alien.
-
-        Parameter bolt: The laser bolt to check
-        Precondition: bolt is of class Bolt
-        """
-        upperleft_x=bolt.getX()-BOLT_WIDTH/2
-        upperleft_y=bolt.getY()+BOLT_HEIGHT/2
-        upperright_x=bolt.getX()+BOLT_WIDTH/2
-        upperright_y=bolt.getY()+BOLT_HEIGHT/2
-        lowerleft_x=bolt.getX()-BOLT_WIDTH/2
-        lowerleft_y=bolt.getY()-BOLT_HEIGHT/2
-        lowerright_x=bolt.getX()+BOLT_WIDTH/2
-        lowerright_y=bolt.getY()-BOLT_HEIGHT/2
-        para1= (self.contains([upperleft_x,upperleft_y]) or
-        self.contains([upperright_x,upperright_y]) or
-        self.contains([lowerleft_x,lowerleft_y]) or
-        self.contains([lowerright_x,lowerright_y]))
-        para2= not bolt.isPlayerBolt()
-        return para1 and para2
-
     # ADD MORE METHODS (PROPERLY SPECIFIED) AS NECESSARY
     def changeX(self,value):
         """
@@ -212,30 +188,6 @@ class Alien(GSprite):
         """
         super().__init__(x=x,y=y,width=w,height=h,source=source,format=(3,2))
 
-    # METHOD TO CHECK FOR COLLISION (IF DESIRED)
-    def collides(self,bolt):
-        """
-        Returns: True if the bolt was fired by the player and collides with this
-                 alien. False otherwise.
-
-        Parameter bolt: The laser bolt to check
-        Precondition: bolt is of class Bolt
-        """
-        upperleft_x=bolt.getX()-BOLT_WIDTH/2
-        upperleft_y=bolt.getY()+BOLT_HEIGHT/2
-        upperright_x=bolt.getX()+BOLT_WIDTH/2
-        upperright_y=bolt.getY()+BOLT_HEIGHT/2
-        lowerleft_x=bolt.getX()-BOLT_WIDTH/2
-        lowerleft_y=bolt.getY()-BOLT_HEIGHT/2
-        lowerright_x=bolt.getX()+BOLT_WIDTH/2
-        lowerright_y=bolt.getY()-BOLT_HEIGHT/2
-        para1= (self.contains([upperleft_x,upperleft_y]) or
-        self.contains([upperright_x,upperright_y]) or
-        self.contains([lowerleft_x,lowerleft_y]) or
-        self.contains([lowerright_x,lowerright_y]))
-        para2=bolt.isPlayerBolt()
-        return para1 and para2
-
     # ADD MORE METHODS (PROPERLY SPECIFIED) AS NECESSARY
     def changeY(self,value):
         """
@@ -471,25 +423,3 @@ class BarrierWall(GSprite):
         """
         if self.frame < 3:
             self.frame=self.frame+1
-
-    def collides(self,bolt):
-        """
-        Returns: True if the bolt was fired by the player and collides with this
-        alien.
-
-        Parameter bolt: The laser bolt to check
-        Precondition: bolt is of class Bolt
-        """
-        upperleft_x=bolt.getX()-BOLT_WIDTH/2
-        upperleft_y=bolt.getY()+BOLT_HEIGHT/2
-        upperright_x=bolt.getX()+BOLT_WIDTH/2
-        upperright_y=bolt.getY()+BOLT_HEIGHT/2
-        lowerleft_x=bolt.getX()-BOLT_WIDTH/2
-        lowerleft_y=bolt.getY()-BOLT_HEIGHT/2
-        lowerright_x=bolt.getX()+BOLT_WIDTH/2
-        lowerright_y=bolt.getY()-BOLT_HEIGHT/2
-        para1= (self.contains([upperleft_x,upperleft_y]) or
-        self.contains([upperright_x,upperright_y]) or
-        self.contains([lowerleft_x,lowerleft_y]) or
-        self.contains([lowerright_x,lowerright_y]))
-        return para1
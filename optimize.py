@@ -0,0 +1,69 @@
+"""
+Asset build script for Alien Invaders
+
+Several images in the Images folder are far larger than they are ever drawn.
+This script writes a copy of every image listed in IMAGE_SIZES (consts.py),
+shrunk to the largest size it is drawn at, into the ImageCache folder next to
+Images.  GameApp.load_texture uses the copy in ImageCache whenever one
+exists, so run this script again after changing an image or its size:
+
+    python optimize.py
+
+Images that are already small enough get no copy, and neither do images
+whose copy would take more bytes than the original (a photo saved as PNG can
+grow when it is resampled); the game keeps loading those from Images.
+ImageCache is not checked in, so run this script once after checking out
+the game as well.  The copies keep only the pixels; metadata such as
+color profiles and text chunks is dropped.  The script needs the Pillow
+package, which the game itself does not.
+"""
+import os
+import sys
+from consts import *
+
+
+def optimize(folder):
+    """
+    Writes the optimized copies of the images in folder/Images to
+    folder/ImageCache.
+
+    Parameter folder: the folder holding Images
+    Precondition: folder is a string naming a directory
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        print('optimize.py needs Pillow; install it with pip install Pillow')
+        sys.exit(1)
+
+    source=os.path.join(folder,'Images')
+    target=os.path.join(folder,'ImageCache')
+    if not os.path.isdir(target):
+        os.mkdir(target)
+
+    for name in sorted(IMAGE_SIZES):
+        image=Image.open(os.path.join(source,name))
+        mode='RGBA' if 'A' in image.getbands() or 'transparency' in image.info \
+             else 'RGB'
+        width,height=IMAGE_SIZES[name]
+        path=os.path.join(target,name)
+        if image.width <= width and image.height <= height:
+            if os.path.exists(path):
+                os.remove(path)
+            continue
+        pixels=image.convert(mode).resize((min(image.width,width),
+                                           min(image.height,height)),
+                                          Image.LANCZOS)
+        pixels.info={}
+        pixels.save(path,optimize=True,icc_profile=None,pnginfo=None)
+        before=os.path.getsize(os.path.join(source,name))
+        after=os.path.getsize(path)
+        if after >= before:
+            os.remove(path)
+            print(name,'kept: the copy is',after,'bytes against',before)
+            continue
+        print(name,image.size,'->',pixels.size,before,'->',after,'bytes')
+
+
+if __name__ == '__main__':
+    optimize(os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,1289 @@
+"""
+Headless simulation module for Alien Invaders
+
+This module contains the simulation core for a single wave of Alien Invaders.
+It tracks the positions of the ship, the aliens, the laser bolts and the
+barrier walls, together with the lives left and the score, using nothing but
+plain Python objects. It does not import Kivy (or game2d) at all, so a wave can
+be stepped thousands of times per second on a machine with no display and no
+audio device.
+
+The subcontroller Wave drives an instance of WaveSim from its update method and
+only reads from it when drawing. Anything that needs a window (sprites) or a
+speaker (sounds) stays in wave.py.
+"""
+from consts import *
+import numpy as np
+import math
+import random
+
+# PRIMARY RULE: This module may only access consts.py. It must never import
+# game2d, models.py or wave.py, or it will stop working without a display.
+
+
+def alienPoints(row):
+    """
+    Returns the number of points for destroying an alien in the given row.
+
+    Row 0 is the top row of the wave.  Rows that share an alien image are
+    worth the same number of points.
+
+    Parameter row: the row of the destroyed alien
+    Precondition: row is an int; 0 <= row < ALIEN_ROWS
+    """
+    if ALIEN_ROWS%2==0:
+        if (row+1)%2==0:
+            return int((row+1)/2*10)
+        return int((row+2)/2*10)
+    if (row+1)%2==0:
+        return int((row+1)/2*10)+10
+    return int(row/2*10)+10
+
+
+def boltSweeps(bx,y0,y1,x,y,w,h):
+    """
+    Returns True if a bolt moving from (bx,y0) to (bx,y1) touches the given
+    rectangle anywhere along the way.
+
+    Bolts only move up or down, so the bolt sweeps out a taller box with the
+    same width.  Horizontally one side of the bolt must be inside the
+    rectangle, as for GObject.contains on a corner; vertically the swept box
+    and the rectangle must overlap.  When y0 == y1 this is the same as asking
+    GObject.contains about each corner of the bolt, because a bolt is shorter
+    than everything it can hit.  This is the one collision test of the game;
+    sweepHits uses it, or its vectorized version boltsSweep, for every bolt.
+    Testing the whole path means a fast bolt, or a slow update rate, can no
+    longer jump over a thin target between two updates.
+
+    Parameter bx: the x-coordinate of the center of the bolt
+    Precondition: bx is an int or float
+
+    Parameter y0: the y-coordinate of the center of the bolt before it moved
+    Precondition: y0 is an int or float
+
+    Parameter y1: the y-coordinate of the center of the bolt after it moved
+    Precondition: y1 is an int or float
+
+    Parameter x: the x-coordinate of the center of the rectangle
+    Precondition: x is an int or float
+
+    Parameter y: the y-coordinate of the center of the rectangle
+    Precondition: y is an int or float
+
+    Parameter w: the width of the rectangle
+    Precondition: w is an int or float > 0
+
+    Parameter h: the height of the rectangle
+    Precondition: h is an int or float > 0
+    """
+    return ((abs(bx-BOLT_WIDTH/2-x) < w/2 or abs(bx+BOLT_WIDTH/2-x) < w/2) and
+            min(y0,y1)-BOLT_HEIGHT/2 < y+h/2 and
+            max(y0,y1)+BOLT_HEIGHT/2 > y-h/2)
+
+
+def boltsSweep(bx,y0,y1,x,y,w,h):
+    """
+    Returns an array of flags saying which moving bolts touch the given
+    rectangle.
+
+    This is the vectorized version of boltSweeps.
+
+    Parameter bx: the x-coordinates of the centers of the bolts
+    Precondition: bx is a 1d float array
+
+    Parameter y0: the y-coordinates of the bolt centers before they moved
+    Precondition: y0 is a 1d float array the same length as bx
+
+    Parameter y1: the y-coordinates of the bolt centers after they moved
+    Precondition: y1 is a 1d float array the same length as bx
+
+    Parameter x: the x-coordinate of the center of the rectangle
+    Precondition: x is an int or float
+
+    Parameter y: the y-coordinate of the center of the rectangle
+    Precondition: y is an int or float
+
+    Parameter w: the width of the rectangle
+    Precondition: w is an int or float > 0
+
+    Parameter h: the height of the rectangle
+    Precondition: h is an int or float > 0
+    """
+    inx=((np.abs(bx-BOLT_WIDTH/2-x)<w/2) | (np.abs(bx+BOLT_WIDTH/2-x)<w/2))
+    iny=((np.minimum(y0,y1)-BOLT_HEIGHT/2<y+h/2) &
+         (np.maximum(y0,y1)+BOLT_HEIGHT/2>y-h/2))
+    return inx & iny
+
+
+def sweepHits(bolts,xs,ys,w,h,player=None):
+    """
+    Returns the list of (j, k) pairs such that live bolt k touches rectangle j
+    during its last move.
+
+    The rectangles are all w by h, and rectangle j is centered at
+    (xs[j],ys[j]).  The pairs are ordered by rectangle, then by bolt.  With
+    fewer than BOLT_VECTOR_MIN bolts to test, each bolt is tested with
+    boltSweeps on the values from getValues, since NumPy takes longer to set
+    up a call than to test a handful of bolts.  Otherwise every bolt is tested
+    against every rectangle with one call to boltsSweep.
+
+    Parameter bolts: The laser bolts to check
+    Precondition: bolts is of class BoltBuffer
+
+    Parameter xs: the x-coordinates of the centers of the rectangles
+    Precondition: xs is a list of int or float
+
+    Parameter ys: the y-coordinates of the centers of the rectangles
+    Precondition: ys is a list of int or float the same length as xs
+
+    Parameter w: the width of every rectangle
+    Precondition: w is an int or float > 0
+
+    Parameter h: the height of every rectangle
+    Precondition: h is an int or float > 0
+
+    Parameter player: which bolts to test: True for player bolts only, False
+    for alien bolts only, None for both
+    Precondition: player is a bool or None
+    """
+    tested=bolts.getLive(player)
+    if tested==0 or len(xs)==0:
+        return []
+    if tested<BOLT_VECTOR_MIN:
+        (bx,y0,y1,owner,alive)=bolts.getValues()
+        ks=bolts.getLivePositions(player)
+        hits=[]
+        for j in range(len(xs)):
+            for k in ks:
+                if boltSweeps(bx[k],y0[k],y1[k],xs[j],ys[j],w,h):
+                    hits.append((j,k))
+        return hits
+    (bx,y0,y1,owner,live)=bolts.getArrays()
+    if player is True:
+        live=live & owner
+    elif player is False:
+        live=live & ~owner
+    if len(xs)==1:
+        ks=np.flatnonzero(live & boltsSweep(bx,y0,y1,xs[0],ys[0],w,h))
+        return [(0,k) for k in ks.tolist()]
+    touch=boltsSweep(bx,y0,y1,np.array(xs)[:,np.newaxis],
+                     np.array(ys)[:,np.newaxis],w,h)
+    (js,ks)=np.nonzero(touch & live)
+    return list(zip(js.tolist(),ks.tolist()))
+
+
+class ShipState(object):
+    """
+    A class to represent the position of the player ship.
+
+    INSTANCE ATTRIBUTES:
+        _x: the x-coordinate of the center of the ship [int or float]
+        _y: the y-coordinate of the center of the ship [int or float]
+    """
+    def getX(self):
+        """
+        Returns the x-coordinate of the ship.
+        """
+        return self._x
+
+    def getY(self):
+        """
+        Returns the y-coordinate of the ship.
+        """
+        return self._y
+
+    def __init__(self,x,y):
+        """
+        Initializes the ship state.
+
+        Parameter x: the x-coordinate of the center of the ship
+        Precondition: x is an int or float
+
+        Parameter y: the y-coordinate of the center of the ship
+        Precondition: y is an int or float
+        """
+        self._x=x
+        self._y=y
+
+    def changeX(self,value):
+        """
+        The method increases the ship's x-coordinate by value.
+        """
+        self._x+=value
+
+    def collides(self,bolts):
+        """
+        Returns: the positions of the live alien bolts that collide with this
+        ship during their last move, in order [list of int]
+
+        Parameter bolts: The laser bolts to check
+        Precondition: bolts is of class BoltBuffer
+        """
+        return [k for (j,k) in sweepHits(bolts,[self._x],[self._y],
+                                         SHIP_WIDTH,SHIP_HEIGHT,False)]
+
+
+class Formation(object):
+    """
+    A class to represent every alien of a wave as NumPy arrays.
+
+    The aliens are arranged in ALIEN_ROWS rows of ALIENS_IN_ROW columns; row 0
+    is the top row of the wave.  The formation never changes shape, so every
+    alien in a column shares an x-coordinate and every alien in a row shares a
+    y-coordinate.  The formation only stores the starting coordinate of each
+    column and row, plus the distance the whole formation has moved.  Marching
+    and descending therefore only change two numbers.
+
+    The formation also keeps the bounding box of the live aliens up to date
+    as they move and die, so the edge tests in WaveSim never look at more than
+    one column or row.
+
+    INSTANCE ATTRIBUTES:
+        _colX: the starting x-coordinate of every column [1d float array]
+        _rowY: the starting y-coordinate of every row [1d float array]
+        _dx: how far the formation has moved right [float]
+        _dy: how far the formation has moved up (negative is down) [float]
+        _frame: the animation frame of every alien [2d int array of 0 or 1]
+        _alive: whether each alien is still alive [2d bool array]
+        _colCount: the number of live aliens in every column [1d int array]
+        _rowCount: the number of live aliens in every row [1d int array]
+        _count: the number of live aliens [int >= 0]
+        _first: the index of the left-most column with a live alien
+                [int; _first > _last when _count is 0]
+        _last: the index of the right-most column with a live alien [int]
+        _low: the index of the lowest row with a live alien
+              [int; -1 when _count is 0]
+        _colLow: the index of the lowest live row of every column
+                 [list of int; -1 for an empty column]
+        _occupied: the indices of the columns with a live alien, in no
+                   particular order [list of int]
+        _slot: the position of every column in _occupied [list of int;
+               -1 for an empty column]
+        _pitchX: the distance between two columns [float > 0]
+        _pitchY: the distance between two rows [float > 0]
+        _left: the starting left edge of column 0 [float]
+        _top: the starting top edge of row 0 [float]
+        _version: the number of times the formation has moved or lost an
+                  alien [int >= 0]
+    """
+    def getX(self):
+        """
+        Returns a new 2d array with the x-coordinate of every alien.
+        """
+        return np.tile(self._colX+self._dx,(ALIEN_ROWS,1))
+
+    def getY(self):
+        """
+        Returns a new 2d array with the y-coordinate of every alien.
+        """
+        return np.tile((self._rowY+self._dy)[:,np.newaxis],(1,ALIENS_IN_ROW))
+
+    def getFrame(self):
+        """
+        Returns the array of animation frames of the aliens.
+        """
+        return self._frame
+
+    def getAlive(self):
+        """
+        Returns the array of flags saying which aliens are still alive.
+        """
+        return self._alive
+
+    def getVersion(self):
+        """
+        Returns a number that changes every time an alien moves, changes frame
+        or dies.
+
+        Code that copies the aliens somewhere else, such as the sprites in
+        Wave, can keep the version it copied and skip the copy while the
+        version stays the same.
+        """
+        return self._version
+
+    def isAlive(self,m,n):
+        """
+        Returns True if the nth alien of the mth row is still alive.
+
+        Parameter m: the row of the alien
+        Precondition: m is an int; 0 <= m < ALIEN_ROWS
+
+        Parameter n: the column of the alien
+        Precondition: n is an int; 0 <= n < ALIENS_IN_ROW
+        """
+        return bool(self._alive[m,n])
+
+    def isEmpty(self):
+        """
+        Returns True if every alien is dead.
+        """
+        return self._count==0
+
+    def columnX(self,col):
+        """
+        Returns the x-coordinate of every alien in column col.
+
+        Parameter col: the column index
+        Precondition: col is an int; 0 <= col < ALIENS_IN_ROW
+        """
+        return float(self._colX[col])+self._dx
+
+    def rowY(self,row):
+        """
+        Returns the y-coordinate of every alien in row row.
+
+        Parameter row: the row index
+        Precondition: row is an int; 0 <= row < ALIEN_ROWS
+        """
+        return float(self._rowY[row])+self._dy
+
+    def __init__(self):
+        """
+        Initializes a full formation of ALIEN_ROWS by ALIENS_IN_ROW aliens.
+        """
+        cols=np.arange(1,ALIENS_IN_ROW+1)
+        rows=np.arange(1,ALIEN_ROWS+1)
+        self._colX=(ALIEN_H_SEP*cols+(cols-1)*ALIEN_WIDTH
+                    +ALIEN_WIDTH/2).astype(float)
+        self._rowY=(GAME_HEIGHT-(ALIEN_CEILING+(rows-1)*ALIEN_V_SEP
+                    +ALIEN_HEIGHT*(rows-1+1/2))).astype(float)
+        self._dx=0.0
+        self._dy=0.0
+        self._frame=np.zeros((ALIEN_ROWS,ALIENS_IN_ROW),dtype=int)
+        self._alive=np.ones((ALIEN_ROWS,ALIENS_IN_ROW),dtype=bool)
+        self._colCount=np.full(ALIENS_IN_ROW,ALIEN_ROWS,dtype=int)
+        self._rowCount=np.full(ALIEN_ROWS,ALIENS_IN_ROW,dtype=int)
+        self._count=ALIEN_ROWS*ALIENS_IN_ROW
+        self._first=0
+        self._last=ALIENS_IN_ROW-1
+        self._low=ALIEN_ROWS-1
+        self._colLow=[ALIEN_ROWS-1]*ALIENS_IN_ROW
+        self._occupied=list(range(ALIENS_IN_ROW))
+        self._slot=list(range(ALIENS_IN_ROW))
+        self._pitchX=float(ALIEN_WIDTH+ALIEN_H_SEP)
+        self._pitchY=float(ALIEN_HEIGHT+ALIEN_V_SEP)
+        self._left=float(self._colX[0])-ALIEN_WIDTH/2
+        self._top=float(self._rowY[0])+ALIEN_HEIGHT/2
+        self._version=0
+
+    def march(self,dx):
+        """
+        Moves every alien dx pixels sideways and advances its frame.
+
+        Parameter dx: the number of pixels to move (negative is left)
+        Precondition: dx is an int or float
+        """
+        self._dx+=dx
+        self._frame^=1
+        self._version+=1
+
+    def descend(self,dy):
+        """
+        Moves every alien dy pixels down.
+
+        Parameter dy: the number of pixels to move down
+        Precondition: dy is an int or float
+        """
+        self._dy-=dy
+        self._version+=1
+
+    def minX(self):
+        """
+        Returns the x-coordinate of the left-most live alien.
+
+        Precondition: at least one alien is alive
+        """
+        return self.columnX(self._first)
+
+    def maxX(self):
+        """
+        Returns the x-coordinate of the right-most live alien.
+
+        Precondition: at least one alien is alive
+        """
+        return self.columnX(self._last)
+
+    def minY(self):
+        """
+        Returns the y-coordinate of the lowest live alien.
+
+        Precondition: at least one alien is alive
+        """
+        return self.rowY(self._low)
+
+    def bounds(self):
+        """
+        Returns the box (x, y, w, h) that holds every live alien, as a center
+        and a size.
+
+        The box reaches from the left-most to the right-most live column and
+        from the lowest live row to the top row of the formation, so a bolt
+        outside it cannot hit any alien.
+
+        Precondition: at least one alien is alive
+        """
+        left=self.minX()-ALIEN_WIDTH/2
+        right=self.maxX()+ALIEN_WIDTH/2
+        bottom=self.minY()-ALIEN_HEIGHT/2
+        top=self._top+self._dy
+        return ((left+right)/2,(bottom+top)/2,right-left,top-bottom)
+
+    def count(self):
+        """
+        Returns the number of aliens still alive.
+        """
+        return self._count
+
+    def bottom(self):
+        """
+        Returns the bottom edge of the lowest live alien, or None if every
+        alien is dead.
+        """
+        if self.isEmpty():
+            return None
+        return self.minY()-ALIEN_HEIGHT/2
+
+    def occupiedColumns(self):
+        """
+        Returns the list of column indices with at least one live alien.
+
+        The list is in no particular order.  The method returns the attribute
+        _occupied directly, so it must not be modified.
+        """
+        return self._occupied
+
+    def lowestInColumn(self,col):
+        """
+        Returns the row index of the lowest live alien of column col, or -1
+        if the column is empty.
+
+        Parameter col: the column to search
+        Precondition: col is an int; 0 <= col < ALIENS_IN_ROW
+        """
+        return self._colLow[col]
+
+    def kill(self,m,n):
+        """
+        Marks the nth alien of the mth row as dead.
+
+        The bounding box only moves if the alien was the last one alive in an
+        outer column or in the lowest row.  The lowest alien of column n is
+        only searched for again if this alien was it.
+
+        Parameter m: the row of the alien
+        Precondition: m is an int; 0 <= m < ALIEN_ROWS
+
+        Parameter n: the column of the alien
+        Precondition: n is an int; 0 <= n < ALIENS_IN_ROW; the alien is alive
+        """
+        self._alive[m,n]=False
+        self._count-=1
+        self._version+=1
+        self._colCount[n]-=1
+        self._rowCount[m]-=1
+        if self._colCount[n]==0:
+            # Swap the last occupied column into the empty slot
+            moved=self._occupied.pop()
+            if moved!=n:
+                self._occupied[self._slot[n]]=moved
+                self._slot[moved]=self._slot[n]
+            self._slot[n]=-1
+            self._colLow[n]=-1
+        elif self._colLow[n]==m:
+            low=m-1
+            while not self._alive[low,n]:
+                low-=1
+            self._colLow[n]=low
+        while self._first <= self._last and self._colCount[self._first]==0:
+            self._first+=1
+        while self._last >= self._first and self._colCount[self._last]==0:
+            self._last-=1
+        while self._low >= 0 and self._rowCount[self._low]==0:
+            self._low-=1
+
+    def cellRange(self,lo,hi,start,pitch,size):
+        """
+        Returns the (first, last) indices of the grid cells that the interval
+        lo..hi may overlap, clamped to 0..size-1.
+
+        The cells are laid out every pitch pixels from start; first > last
+        means the interval misses the grid.
+
+        Parameter lo: the low end of the interval, measured away from start
+        Precondition: lo is an int or float
+
+        Parameter hi: the high end of the interval, measured away from start
+        Precondition: hi is an int or float >= lo
+
+        Parameter start: the edge of the first cell
+        Precondition: start is an int or float
+
+        Parameter pitch: the distance between the edges of two cells
+        Precondition: pitch is an int or float > 0
+
+        Parameter size: the number of cells
+        Precondition: size is an int > 0
+        """
+        first=max(0,int(math.floor((lo-start)/pitch)))
+        last=min(size-1,int(math.floor((hi-start)/pitch)))
+        return (first,last)
+
+    def hit(self,bx,y0,y1):
+        """
+        Returns the (row, column) of the first live alien touched by a bolt
+        moving from (bx,y0) to (bx,y1), or None if the bolt touches no alien.
+
+        The formation is a regular grid, so the cells that the bolt can
+        overlap along its path are computed directly from its coordinates.
+        Only the aliens in those cells are tested with boltSweeps, no matter
+        how large the formation is.  The rows are searched in the direction
+        the bolt travels, so the alien it reaches first is the one returned.
+
+        Parameter bx: the x-coordinate of the center of the bolt
+        Precondition: bx is an int or float
+
+        Parameter y0: the y-coordinate of the center of the bolt before it moved
+        Precondition: y0 is an int or float
+
+        Parameter y1: the y-coordinate of the center of the bolt after it moved
+        Precondition: y1 is an int or float
+        """
+        left=self._left+self._dx
+        top=self._top+self._dy
+        cols=self.cellRange(bx-BOLT_WIDTH/2,bx+BOLT_WIDTH/2,left,
+                            self._pitchX,ALIENS_IN_ROW)
+        # Rows are numbered from the top down
+        rows=self.cellRange(top-max(y0,y1)-BOLT_HEIGHT/2,
+                            top-min(y0,y1)+BOLT_HEIGHT/2,0,
+                            self._pitchY,ALIEN_ROWS)
+        if y1 > y0:
+            order=range(rows[1],rows[0]-1,-1)
+        else:
+            order=range(rows[0],rows[1]+1)
+        for m in order:
+            for n in range(cols[0],cols[1]+1):
+                if (self._alive[m,n] and
+                    boltSweeps(bx,y0,y1,self.columnX(n),self.rowY(m),
+                               ALIEN_WIDTH,ALIEN_HEIGHT)):
+                    return (m,n)
+        return None
+
+
+class BoltBuffer(object):
+    """
+    A class to represent every laser bolt on screen.
+
+    The buffer has room for BOLT_POOL_SIZE bolts.  The bolts on screen are
+    stored in the order they were fired, in plain Python lists with one entry
+    per bolt.  A bolt that leaves the screen or hits something is only marked
+    as dead; compact then removes the dead bolts in one pass at the end of
+    the update.
+
+    Most of the time there are only a few bolts on screen, and for those a
+    NumPy call costs more to set up than it saves, so the buffer is moved,
+    culled and tested one bolt at a time.  With BOLT_VECTOR_MIN bolts or
+    more, the buffer also keeps a copy of the lists as NumPy arrays, which
+    it moves, culls and compacts with whole-array operations, and which the
+    getters getX, getY, getLastY, getPlayer and getAlive return for testing
+    many bolts in one call (see sweepHits).  Below that, the arrays are only
+    made if they are asked for, and thrown away when the buffer changes.
+
+    INSTANCE ATTRIBUTES:
+        _x: the x-coordinates of the bolt centers [list of float]
+        _y: the y-coordinates of the bolt centers [list of float]
+        _lastY: the y-coordinates of the bolt centers before the last move
+                [list of float]
+        _velocity: the velocity in y direction of every bolt [list of float]
+        _player: whether each bolt was fired by the player [list of bool]
+        _alive: whether each bolt is still in play [list of bool]
+        _capacity: the maximum number of bolts on screen [int > 0]
+        _dead: the number of bolts marked dead since the last compact
+               [int >= 0]
+        _live: the number of live alien bolts and of live player bolts
+               [list of 2 int >= 0]
+        _arrays: the lists _x, _lastY, _y, _player, _alive and _velocity
+                 as arrays, or None if they are out of date
+                 [list of 1d array, or None]
+    """
+    def getCount(self):
+        """
+        Returns the number of bolts on screen, including any marked dead
+        since the last compact.
+        """
+        return len(self._x)
+
+    def getCapacity(self):
+        """
+        Returns the maximum number of bolts on screen.
+        """
+        return self._capacity
+
+    def getLive(self,player=None):
+        """
+        Returns the number of live bolts on screen.
+
+        Parameter player: which bolts to count: True for player bolts only,
+        False for alien bolts only, None for both
+        Precondition: player is a bool or None
+        """
+        if player is None:
+            return self._live[0]+self._live[1]
+        return self._live[int(player)]
+
+    def getX(self):
+        """
+        Returns an array of the x-coordinates of the bolts on screen.
+        """
+        return self.getArrays()[0]
+
+    def getY(self):
+        """
+        Returns an array of the y-coordinates of the bolts on screen.
+        """
+        return self.getArrays()[2]
+
+    def getLastY(self):
+        """
+        Returns an array of the y-coordinates of the bolts on screen before
+        their last move.
+        """
+        return self.getArrays()[1]
+
+    def getPlayer(self):
+        """
+        Returns an array of flags saying which bolts on screen the player fired.
+        """
+        return self.getArrays()[3]
+
+    def getAlive(self):
+        """
+        Returns an array of flags saying which bolts on screen are still in
+        play.
+        """
+        return self.getArrays()[4]
+
+    def getLivePositions(self,player=None):
+        """
+        Returns the positions of the live bolts on screen, in order.
+
+        Parameter player: which bolts to list: True for player bolts only,
+        False for alien bolts only, None for both
+        Precondition: player is a bool or None
+        """
+        n=len(self._x)
+        if n<BOLT_VECTOR_MIN:
+            return [k for k in range(n) if self._alive[k] and
+                    (player is None or self._player[k]==player)]
+        arrays=self.mirror()
+        if player is None:
+            return np.flatnonzero(arrays[4]).tolist()
+        if player:
+            return np.flatnonzero(arrays[4] & arrays[3]).tolist()
+        return np.flatnonzero(arrays[4] & ~arrays[3]).tolist()
+
+    def getValues(self):
+        """
+        Returns the bolts on screen as plain Python lists.
+
+        The result is the tuple (x, lastY, y, player, alive), where each item
+        is a list with one entry per bolt on screen.  The lists belong to the
+        buffer, so they must not be modified, and they are only good until
+        the next call to advance or compact.
+        """
+        return (self._x,self._lastY,self._y,self._player,self._alive)
+
+    def getArrays(self):
+        """
+        Returns the bolts on screen as NumPy arrays.
+
+        The result is the tuple (x, lastY, y, player, alive) of getValues,
+        with every list turned into a 1d array.  The arrays are made once and
+        reused until the buffer changes, so they must not be modified.
+        """
+        arrays=self.mirror()
+        return (arrays[0],arrays[1],arrays[2],arrays[3],arrays[4])
+
+    def mirror(self):
+        """
+        Returns the attribute _arrays, making it first if it is out of date.
+        """
+        if self._arrays is None:
+            self._arrays=[np.array(self._x,dtype=float),
+                          np.array(self._lastY,dtype=float),
+                          np.array(self._y,dtype=float),
+                          np.array(self._player,dtype=bool),
+                          np.array(self._alive,dtype=bool),
+                          np.array(self._velocity,dtype=float)]
+        return self._arrays
+
+    def __init__(self,capacity=BOLT_POOL_SIZE):
+        """
+        Initializes an empty buffer with room for capacity bolts.
+
+        Parameter capacity: the maximum number of bolts on screen
+        Precondition: capacity is an int > 0
+        """
+        self._x=[]
+        self._y=[]
+        self._lastY=[]
+        self._velocity=[]
+        self._player=[]
+        self._alive=[]
+        self._capacity=capacity
+        self._dead=0
+        self._live=[0,0]
+        self._arrays=None
+
+    def add(self,x,y,velocity):
+        """
+        Returns True if a bolt was put at (x,y); False if the buffer is full.
+
+        Parameter x: the x-coordinate of the center of the bolt
+        Precondition: x is an int or float
+
+        Parameter y: the y-coordinate of the center of the bolt
+        Precondition: y is an int or float
+
+        Parameter velocity: the velocity of the bolt.
+        Precondition: velocity is an int or float; it is positive for a player
+        bolt and negative for an alien bolt.
+        """
+        if len(self._x)==self._capacity:
+            return False
+        self._x.append(float(x))
+        self._y.append(float(y))
+        self._lastY.append(float(y))
+        self._velocity.append(float(velocity))
+        self._player.append(velocity>0)
+        self._alive.append(True)
+        self._live[int(velocity>0)]+=1
+        self._arrays=None
+        return True
+
+    def kill(self,i):
+        """
+        Marks the bolt at position i as dead, if it is not dead already.
+
+        Parameter i: the position of the bolt
+        Precondition: i is an int; 0 <= i < getCount()
+        """
+        if self._alive[i]:
+            self._alive[i]=False
+            self._dead+=1
+            self._live[int(self._player[i])]-=1
+            if self._arrays is not None:
+                self._arrays[4][i]=False
+
+    def advance(self):
+        """
+        Moves every bolt by its velocity, remembering where it started.
+        """
+        n=len(self._y)
+        if n==0:
+            return
+        self._lastY=self._y
+        if n<BOLT_VECTOR_MIN:
+            self._y=[y+v for (y,v) in zip(self._y,self._velocity)]
+            self._arrays=None
+        else:
+            arrays=self.mirror()
+            arrays[1]=arrays[2]
+            arrays[2]=arrays[2]+arrays[5]
+            self._y=arrays[2].tolist()
+
+    def cull(self):
+        """
+        Returns True if a player bolt left the screen.
+
+        The method marks every bolt past the top or the bottom of the screen
+        as dead.
+        """
+        n=len(self._y)
+        if n<BOLT_VECTOR_MIN:
+            ks=[k for k in range(n) if self._alive[k] and
+                (self._y[k]+BOLT_HEIGHT/2>=GAME_HEIGHT or
+                 self._y[k]+BOLT_HEIGHT/2<=0)]
+        else:
+            arrays=self.mirror()
+            top=arrays[2]+BOLT_HEIGHT/2
+            ks=np.flatnonzero(arrays[4] & ((top>=GAME_HEIGHT) |
+                                           (top<=0))).tolist()
+        lost=False
+        for k in ks:
+            self.kill(k)
+            lost=lost or self._player[k]
+        return lost
+
+    def compact(self):
+        """
+        Removes the dead bolts, keeping the others in order.
+        """
+        if self._dead==0:
+            return
+        if len(self._x)<BOLT_VECTOR_MIN:
+            alive=self._alive
+            self._x=[v for (v,a) in zip(self._x,alive) if a]
+            self._y=[v for (v,a) in zip(self._y,alive) if a]
+            self._lastY=[v for (v,a) in zip(self._lastY,alive) if a]
+            self._velocity=[v for (v,a) in zip(self._velocity,alive) if a]
+            self._player=[v for (v,a) in zip(self._player,alive) if a]
+            self._alive=[True]*len(self._x)
+            self._arrays=None
+        else:
+            keep=self.mirror()[4]
+            arrays=[array[keep] for array in self._arrays]
+            self._x=arrays[0].tolist()
+            self._lastY=arrays[1].tolist()
+            self._y=arrays[2].tolist()
+            self._player=arrays[3].tolist()
+            self._alive=arrays[4].tolist()
+            self._velocity=arrays[5].tolist()
+            self._arrays=arrays
+        self._dead=0
+
+
+class WallState(object):
+    """
+    A class to represent the damage taken by one barrier wall.
+
+    INSTANCE ATTRIBUTES:
+        _x: the x-coordinate of the center of the wall [int or float]
+        _y: the y-coordinate of the center of the wall [int or float]
+        _counter: the number of bolts absorbed since the last frame change
+                  [int in 0..BARRIER_WALL_RESISTANCE]
+        _frame: the current damage frame [int in 0..3]
+    """
+    def getX(self):
+        """
+        Returns the x-coordinate of the barrier wall.
+        """
+        return self._x
+
+    def getY(self):
+        """
+        Returns the y-coordinate of the barrier wall.
+        """
+        return self._y
+
+    def getCounter(self):
+        """
+        Returns the counter of the barrier wall.
+        """
+        return self._counter
+
+    def getFrame(self):
+        """
+        Returns the damage frame of the barrier wall.
+        """
+        return self._frame
+
+    def __init__(self,x,y):
+        """
+        Initializes the barrier wall state.
+
+        Parameter x: the x-coordinate of the center of the wall
+        Precondition: x is an int or float
+
+        Parameter y: the y-coordinate of the center of the wall
+        Precondition: y is an int or float
+        """
+        self._x=x
+        self._y=y
+        self._counter=0
+        self._frame=0
+
+    def hit(self):
+        """
+        Returns True if the wall is destroyed by one more bolt.
+
+        The method adds one to the counter.  Every BARRIER_WALL_RESISTANCE hits
+        the wall moves to its next damage frame; a hit that would go past the
+        last frame destroys the wall.
+        """
+        self._counter+=1
+        if self._counter>=BARRIER_WALL_RESISTANCE:
+            if self._frame==3:
+                return True
+            self._frame+=1
+            self._counter=0
+        return False
+
+
+class WaveSim(object):
+    """
+    This class simulates a single wave of Alien Invaders without any graphics.
+
+    The simulation is advanced with update, which takes the player's controls
+    as plain booleans instead of a GInput.  Sound effects are not played here;
+    the names of the sounds that should be played are queued as cues and
+    collected by the caller with takeCues.
+
+    Collisions are handled in two phases.  The detect methods only read the
+    state and queue one event per bolt that touches something; resolveEvents
+    then applies the whole queue once per update, so nothing is removed
+    while the bolts are being scanned.  An event is a tuple whose first item
+    is its kind:
+        ('ship', k):        alien bolt k hit the ship
+        ('alien', k, m, n): player bolt k hit the alien in row m, column n
+        ('wall', k, wall):  bolt k hit the barrier wall wall
+
+    INSTANCE ATTRIBUTES:
+        _ship:   the player ship [ShipState, or None if it was destroyed]
+        _aliens: the aliens in the wave [Formation]
+        _bolts:  the laser bolts currently on screen [BoltBuffer]
+        _walls:  the barrier walls still standing [list of WallState]
+        _lives:  the number of lives left [int >= 0]
+        _time:   the amount of time since the last alien step [number >= 0]
+        _track:  True if the aliens are marching right; False if left [bool]
+        _numOfShipBolt: the number of player bolts on screen [int in 0..1]
+        _alienBolt: the number of alien steps until aliens fire
+                    [int in 1..BOLT_RATE]
+        _step: the number of alien steps since the last alien bolt [int >= 0]
+        _numAliensKilled: the number of aliens killed so far [int >= 0]
+        _xpos: the x-coordinate of the ship when it was destroyed [float]
+        _ypos: the y-coordinate of the ship when it was destroyed [float]
+        _cues: the names of the sounds to play since the last takeCues
+               [list of str]
+        _events: the collisions found this update and not yet resolved
+                 [list of tuple, possibly empty]
+        _random: the random number generator for alien fire [random.Random]
+    """
+    # GETTERS AND SETTERS
+    def getShip(self):
+        """
+        Returns the ship state, or None if the ship was destroyed.
+        """
+        return self._ship
+
+    def getAliens(self):
+        """
+        Returns the formation of aliens in the wave.
+
+        Any changes made to the formation will modify the set of aliens.
+        """
+        return self._aliens
+
+    def getNumAliens(self):
+        """
+        Returns the number of aliens still alive.
+        """
+        return self._aliens.count()
+
+    def getAlienBottom(self):
+        """
+        Returns the bottom edge of the lowest live alien, or None if every
+        alien is dead.
+        """
+        return self._aliens.bottom()
+
+    def getBolts(self):
+        """
+        Returns the buffer of bolts currently on screen.
+
+        Any changes made to the buffer will modify the set of bolts.
+        """
+        return self._bolts
+
+    def getWalls(self):
+        """
+        Returns the list of barrier walls still standing.
+
+        Any changes made to the list will modify the set of walls.
+        """
+        return self._walls
+
+    def getLives(self):
+        """
+        Returns the number of lives left.
+        """
+        return self._lives
+
+    def takeCues(self):
+        """
+        Returns the names of the sounds queued since the last call.
+
+        The queue is emptied by this call.
+        """
+        cues=self._cues
+        self._cues=[]
+        return cues
+
+    # INITIALIZER
+    def initWalls(self):
+        """
+        Returns a list of NUM_BARRIER_WALL undamaged barrier walls.
+        """
+        walls=[]
+        for i in range(1,NUM_BARRIER_WALL+1):
+            walls.append(WallState(i*BARRIER_WALL_H_SEP,BARRIER_WALL_V))
+        return walls
+
+    def __init__(self,walls=None,life=0,seed=None):
+        """
+        Initializes a new wave simulation.
+
+        Parameter walls: the barrier walls left over from the last wave
+        Precondition: walls is None or a list of WallState. If it is None,
+        a fresh set of walls is created.
+
+        Parameter life: the number of lives left
+        Precondition: life is an int >= 0. If it is 0, the ship starts with
+        SHIP_LIVES lives.
+
+        Parameter seed: the seed for alien fire, to make runs repeatable
+        Precondition: seed is None or any value accepted by random.Random
+        """
+        self._random=random.Random(seed)
+        self._aliens=Formation()
+        self._ship=ShipState(GAME_WIDTH/2,SHIP_BOTTOM)
+        self._bolts=BoltBuffer()
+        self._walls=self.initWalls() if walls is None else walls
+        self._lives=SHIP_LIVES if life==0 else life
+        self._time=0
+        self._track=True
+        self._numOfShipBolt=0
+        self._alienBolt=self._random.randint(1,BOLT_RATE)
+        self._step=0
+        self._numAliensKilled=0
+        self._xpos=GAME_WIDTH/2
+        self._ypos=GAME_HEIGHT/2
+        self._cues=[]
+        self._events=[]
+
+    # UPDATE METHODS
+    def resetShip(self):
+        """
+        Creates a new ship where the last one was destroyed.
+        """
+        self._ship=ShipState(self._xpos,self._ypos)
+
+    def moveShip(self,left,right):
+        """
+        Moves the ship by SHIP_MOVEMENT, keeping it on screen.
+
+        Parameter left: whether the player is holding the left key
+        Precondition: left is a bool
+
+        Parameter right: whether the player is holding the right key
+        Precondition: right is a bool
+        """
+        if self._ship is None:
+            return
+        if self._ship.getX()<=SHIP_WIDTH/2 and left:
+            return
+        if self._ship.getX()>=GAME_WIDTH-SHIP_WIDTH/2 and right:
+            return
+        if left:
+            self._ship.changeX(-SHIP_MOVEMENT)
+        if right:
+            self._ship.changeX(SHIP_MOVEMENT)
+
+    def moveAliens(self,curwave):
+        """
+        Marches the aliens one step if enough time has passed.
+
+        The aliens move down and turn around when they reach either side of
+        the screen.  The time between steps shrinks with every wave and with
+        every alien killed.
+
+        Parameter curwave: the number of waves that have existed since beginning
+        Precondition: curwave is an int >=1
+        """
+        if self._aliens.isEmpty():
+            return
+        if (self._track and
+            GAME_WIDTH-self._aliens.maxX()<=ALIEN_H_SEP+ALIEN_WIDTH/2):
+            self._aliens.descend(ALIEN_V_SEP)
+            self._track=False
+        if (not self._track and
+            self._aliens.minX()<=ALIEN_H_SEP+ALIEN_WIDTH/2):
+            self._aliens.descend(ALIEN_V_SEP)
+            self._track=True
+        if (self._time>=
+        ALIEN_SPEED*SPD_INCRE_EACH_NEW_WAVE**(curwave+self._numAliensKilled-1)):
+            self._aliens.march(ALIEN_H_WALK if self._track else -ALIEN_H_WALK)
+            self._time=0
+            self._step+=1
+
+    def createShipBolt(self,fire):
+        """
+        Fires a player bolt if fire is held and no player bolt is on screen.
+
+        Parameter fire: whether the player is holding a fire key
+        Precondition: fire is a bool
+        """
+        if fire and self._numOfShipBolt==0 and self._ship!=None:
+            if self._bolts.add(self._ship.getX(),self._ship.getY()+
+                             BOLT_HEIGHT/2+SHIP_HEIGHT/2,BOLT_SPEED):
+                self._numOfShipBolt=1
+                self._cues.append('pew')
+
+    def alienFire(self):
+        """
+        Fires a bolt from the lowest alien of a random column when it is time.
+        """
+        if self._step!=self._alienBolt:
+            return
+        self._step=0
+        columns=self._aliens.occupiedColumns()
+        if len(columns)==0:
+            return
+        col=columns[self._random.randint(0,len(columns)-1)]
+        row=self._aliens.lowestInColumn(col)
+        self._bolts.add(self._aliens.columnX(col),
+            self._aliens.rowY(row)-ALIEN_HEIGHT/2-BOLT_HEIGHT/2,-BOLT_SPEED)
+        self._alienBolt=self._random.randint(1,BOLT_RATE)
+
+    def moveBolts(self):
+        """
+        Moves every bolt.
+        """
+        self._bolts.advance()
+
+    def cullBolts(self):
+        """
+        Removes the bolts that left the screen.
+
+        This runs after the collision checks, so a bolt that hits something on
+        its way off the screen still counts.
+        """
+        if self._bolts.cull():
+            self._numOfShipBolt=0
+
+    def detectShip(self):
+        """
+        Queues an event for the first alien bolt that hits the ship.
+        """
+        if self._ship is None:
+            return
+        hits=self._ship.collides(self._bolts)
+        if len(hits)>0:
+            self._events.append(('ship',hits[0]))
+
+    def detectAliens(self):
+        """
+        Queues an event for every player bolt that hits an alien.
+
+        Only the player bolts that touch the box around the live aliens
+        (see Formation.bounds) are looked up in the formation.
+        """
+        if self._aliens.isEmpty():
+            return
+        bolts=self._bolts
+        (x,y,w,h)=self._aliens.bounds()
+        near=sweepHits(bolts,[x],[y],w,h,True)
+        if len(near)==0:
+            return
+        (bx,y0,y1,player,alive)=bolts.getValues()
+        for (j,k) in near:
+            hit=self._aliens.hit(bx[k],y0[k],y1[k])
+            if hit!=None:
+                self._events.append(('alien',k,hit[0],hit[1]))
+
+    def detectWalls(self):
+        """
+        Queues an event for every bolt that hits a barrier wall.
+
+        All the walls are tested in one call to sweepHits.
+        """
+        walls=self._walls
+        hits=sweepHits(self._bolts,[wall.getX() for wall in walls],
+                       [wall.getY() for wall in walls],
+                       BARRIER_WALL_WIDTH,BARRIER_WALL_HEIGHT)
+        for (j,k) in hits:
+            self._events.append(('wall',k,walls[j]))
+
+    def resolveEvents(self,score):
+        """
+        Applies every queued collision event and empties the queue.
+
+        The events are applied in the order they were queued.  An event whose
+        bolt was already used up by an earlier event is dropped, as is an
+        event for an alien or wall that an earlier event destroyed; its bolt
+        stays in play.  Destroyed walls are removed in one pass at the end.
+
+        Parameter score: the score the player earns
+        Precondition: score is a list with int inside
+        """
+        bolts=self._bolts
+        (x,lastY,y,player,alive)=bolts.getValues()
+        destroyed=[]
+        for event in self._events:
+            k=event[1]
+            if not alive[k]:
+                continue
+            kind=event[0]
+            if kind=='ship':
+                if self._ship is None:
+                    continue
+                bolts.kill(k)
+                for j in bolts.getLivePositions(True):
+                    bolts.kill(j)
+                self._xpos=self._ship.getX()
+                self._ypos=self._ship.getY()
+                self._ship=None
+                self._cues.append('blast1')
+                self._numOfShipBolt=0
+                if self._lives>0:
+                    self._lives-=1
+            elif kind=='alien':
+                m=event[2]
+                n=event[3]
+                if not self._aliens.isAlive(m,n):
+                    continue
+                bolts.kill(k)
+                self._aliens.kill(m,n)
+                self._numAliensKilled+=1
+                score[0]+=alienPoints(m)
+                self._cues.append('pop')
+                self._numOfShipBolt=0
+            else:
+                wall=event[2]
+                if wall in destroyed:
+                    continue
+                if player[k]:
+                    self._numOfShipBolt=0
+                bolts.kill(k)
+                if wall.hit():
+                    destroyed.append(wall)
+        del self._events[:]
+        if destroyed:
+            self._walls[:]=[wall for wall in self._walls
+                            if not wall in destroyed]
+
+    def update(self,left,right,fire,dt,curwave,score):
+        """
+        Advances the simulation by one update.
+
+        Parameter left: whether the player is holding the left key
+        Precondition: left is a bool
+
+        Parameter right: whether the player is holding the right key
+        Precondition: right is a bool
+
+        Parameter fire: whether the player is holding a fire key
+        Precondition: fire is a bool
+
+        Parameter dt: The time in seconds since last update
+        Precondition: dt is a number (int or float) >= 0
+
+        Parameter curwave: the number of waves that have existed since beginning
+        Precondition: curwave is an int >=1
+
+        Parameter score: the score the player earns
+        Precondition: score is a list with int inside
+        """
+        self._time+=dt
+        self.moveShip(left,right)
+        self.moveAliens(curwave)
+        self.createShipBolt(fire)
+        self.alienFire()
+        if self._bolts.getCount()==0:
+            return
+        self.moveBolts()
+        self.detectShip()
+        self.detectAliens()
+        self.detectWalls()
+        self.resolveEvents(score)
+        self.cullBolts()
+        self._bolts.compact()
@@ -0,0 +1,10 @@
+"""
+Test configuration for Alien Invaders
+
+The game modules live at the top of the repository rather than in a package,
+so the repository root is put on the path for the tests to import them.
+"""
+import os
+import sys
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
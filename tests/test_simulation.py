@@ -0,0 +1,370 @@
+"""
+Unit tests for the headless simulation module
+
+These tests step WaveSim without Kivy, with repeatable alien fire and random
+controls, and check the invariants of the wave after every update.
+"""
+import random
+
+import pytest
+
+from consts import *
+from simulation import *
+
+
+def play(seed,steps,dt=1/60,check=None):
+    """
+    Steps a wave seeded with seed for at most steps updates.
+
+    The controls are random too, drawn from a generator seeded the same way.
+    A destroyed ship is put back while there are lives left, the way Wave
+    does after STATE_PAUSED.  If check is not None, it is called as
+    check(sim,score,before) after every update, where before is a dict of the
+    values from before the update.  Returns the simulation and the score.
+    """
+    sim=WaveSim(seed=seed)
+    controls=random.Random(seed)
+    score=[0]
+    for step in range(steps):
+        if sim.getShip() is None:
+            if sim.getLives()==0:
+                break
+            sim.resetShip()
+        if sim.getNumAliens()==0:
+            break
+        before={'score':score[0],'lives':sim.getLives(),
+                'walls':len(sim.getWalls()),
+                'alive':sim.getAliens().getAlive().copy(),
+                'frames':[(w,w.getFrame()) for w in sim.getWalls()]}
+        left=controls.random()<0.3
+        right=not left and controls.random()<0.4
+        fire=controls.random()<0.5
+        sim.update(left,right,fire,dt,1,score)
+        if check is not None:
+            check(sim,score,before)
+    return (sim,score)
+
+
+def check_invariants(sim,score,before):
+    """
+    Checks the invariants that must hold after every update.
+    """
+    alive=sim.getAliens().getAlive()
+    assert not (alive & ~before['alive']).any()
+    killed=before['alive'] & ~alive
+    rows=[m for m in range(ALIEN_ROWS) for n in range(ALIENS_IN_ROW)
+          if killed[m,n]]
+    assert score[0]==before['score']+sum(alienPoints(m) for m in rows)
+    assert sim.getNumAliens()==int(alive.sum())
+
+    assert 0<=sim.getLives()<=before['lives']<=SHIP_LIVES
+    assert before['lives']-sim.getLives()<=1
+
+    walls=sim.getWalls()
+    assert len(walls)<=before['walls']
+    for (wall,frame) in before['frames']:
+        if wall in walls:
+            assert frame<=wall.getFrame()<=3
+    for wall in walls:
+        assert 0<=wall.getCounter()<BARRIER_WALL_RESISTANCE
+
+    bolts=sim.getBolts()
+    assert bolts.getCount()<=bolts.getCapacity()
+    assert bolts.getLive(True)<=1
+    assert bolts.getLive(True)+bolts.getLive(False)<=bolts.getCount()
+
+    ship=sim.getShip()
+    if ship is not None:
+        assert SHIP_WIDTH/2-SHIP_MOVEMENT<=ship.getX()
+        assert ship.getX()<=GAME_WIDTH-SHIP_WIDTH/2+SHIP_MOVEMENT
+
+
+def test_alien_points():
+    """
+    Tests that rows sharing an alien image are worth the same points.
+    """
+    points=[alienPoints(m) for m in range(ALIEN_ROWS)]
+    assert all(p>0 and p%10==0 for p in points)
+    assert points==sorted(points)
+    assert len(set(points))==(ALIEN_ROWS+1)//2
+
+
+@pytest.mark.parametrize('seed',[0,1,2,3,4])
+def test_invariants(seed):
+    """
+    Tests the score, lives, wall and alien invariants over a long wave.
+    """
+    (sim,score)=play(seed,6000,check=check_invariants)
+    assert score[0]>0
+    assert sim.getNumAliens()<ALIEN_ROWS*ALIENS_IN_ROW
+
+
+def test_repeatable():
+    """
+    Tests that two waves with the same seed and controls play out the same.
+    """
+    def trace(seed):
+        states=[]
+        def record(sim,score,before):
+            ship=sim.getShip()
+            states.append((score[0],sim.getLives(),sim.getNumAliens(),
+                len(sim.getWalls()),sim.getBolts().getCount(),
+                None if ship is None else ship.getX()))
+        play(seed,2000,check=record)
+        return states
+
+    assert trace(7)==trace(7)
+
+
+def test_fresh_wave():
+    """
+    Tests the state of a wave before its first update.
+    """
+    sim=WaveSim(seed=0)
+    assert sim.getLives()==SHIP_LIVES
+    assert sim.getNumAliens()==ALIEN_ROWS*ALIENS_IN_ROW
+    assert len(sim.getWalls())==NUM_BARRIER_WALL
+    assert sim.getBolts().getCount()==0
+    assert sim.getShip().getX()==GAME_WIDTH/2
+    assert WaveSim(life=1).getLives()==1
+
+
+def test_wall_hit():
+    """
+    Tests that a wall takes BARRIER_WALL_RESISTANCE hits per damage frame.
+    """
+    wall=WallState(0,0)
+    hits=0
+    while not wall.hit():
+        hits+=1
+        assert wall.getFrame()==hits//BARRIER_WALL_RESISTANCE
+    assert hits+1==4*BARRIER_WALL_RESISTANCE
+
+
+@pytest.mark.parametrize('count',[3,BOLT_VECTOR_MIN-1,BOLT_VECTOR_MIN,40])
+def test_sweep_hits(count):
+    """
+    Tests that sweepHits agrees with boltSweeps on either side of
+    BOLT_VECTOR_MIN.
+    """
+    rng=random.Random(count)
+    bolts=BoltBuffer()
+    for i in range(count):
+        bolts.add(rng.uniform(0,GAME_WIDTH),rng.uniform(0,GAME_HEIGHT),
+                  rng.choice([BOLT_SPEED,-BOLT_SPEED]))
+    bolts.advance()
+    bolts.kill(0)
+    xs=[wall*BARRIER_WALL_H_SEP for wall in range(1,NUM_BARRIER_WALL+1)]
+    ys=[BARRIER_WALL_V]*len(xs)
+    w=BARRIER_WALL_WIDTH*2
+    h=GAME_HEIGHT/2
+    (bx,y0,y1,player,alive)=bolts.getValues()
+    for who in (None,True,False):
+        expect=[(j,k) for j in range(len(xs)) for k in range(count)
+                if alive[k] and (who is None or player[k]==who)
+                and boltSweeps(bx[k],y0[k],y1[k],xs[j],ys[j],w,h)]
+        assert sweepHits(bolts,xs,ys,w,h,who)==expect
+        single=[(0,k) for (j,k) in expect if j==0]
+        assert sweepHits(bolts,xs[:1],ys[:1],w,h,who)==single
+
+
+def test_no_tunneling():
+    """
+    Tests that a bolt crossing a whole alien or wall in one update hits it.
+
+    The bolts move further in one update than the height of the target plus
+    their own height, so they are clear of the target both before and after
+    the move.  The old point test, which only looked at where the bolt ended
+    up (boltSweeps with y0 == y1), misses them.
+    """
+    aliens=Formation()
+    m=ALIEN_ROWS-1
+    n=ALIENS_IN_ROW//2
+    aliens.kill(m-1,n)
+    x=aliens.columnX(n)
+    y=aliens.rowY(m)
+    reach=ALIEN_HEIGHT/2+BOLT_HEIGHT/2+1
+    assert 2*reach>ALIEN_HEIGHT+BOLT_HEIGHT
+    (y0,y1)=(y-reach,y+reach)
+    assert boltSweeps(x,y0,y1,x,y,ALIEN_WIDTH,ALIEN_HEIGHT)
+    assert not boltSweeps(x,y0,y0,x,y,ALIEN_WIDTH,ALIEN_HEIGHT)
+    assert not boltSweeps(x,y1,y1,x,y,ALIEN_WIDTH,ALIEN_HEIGHT)
+    assert aliens.hit(x,y0,y1)==(m,n)
+    assert aliens.hit(x,y1,y1) is None
+
+    sim=WaveSim(seed=0)
+    wall=sim.getWalls()[0]
+    reach=BARRIER_WALL_HEIGHT/2+BOLT_HEIGHT/2+1
+    speed=2*reach
+    assert speed>BARRIER_WALL_HEIGHT+BOLT_HEIGHT
+    (x,y)=(wall.getX(),wall.getY())
+    assert not boltSweeps(x,y-reach,y-reach,x,y,
+                          BARRIER_WALL_WIDTH,BARRIER_WALL_HEIGHT)
+    assert sim.getBolts().add(x,y+reach,-speed)
+    sim.update(False,False,False,0,1,[0])
+    assert wall.getCounter()==1
+    assert sim.getBolts().getCount()==0
+
+
+def first_alien(aliens,bx,y0,y1):
+    """
+    Returns the (row, column) of the first live alien a bolt reaches, found
+    by testing every alien, or None if it reaches none.
+    """
+    touched=[(m,n) for m in range(ALIEN_ROWS) for n in range(ALIENS_IN_ROW)
+             if aliens.isAlive(m,n) and
+             boltSweeps(bx,y0,y1,aliens.columnX(n),aliens.rowY(m),
+                        ALIEN_WIDTH,ALIEN_HEIGHT)]
+    if len(touched)==0:
+        return None
+    up=y1>y0
+    return min(touched,key=lambda cell: (-cell[0] if up else cell[0],cell[1]))
+
+
+@pytest.mark.parametrize('seed',[0,1,2])
+def test_formation_hit(seed):
+    """
+    Tests Formation.hit and bounds against every alien, with enough bolts
+    that sweepHits takes the NumPy path.
+    """
+    rng=random.Random(seed)
+    aliens=Formation()
+    aliens.march(rng.uniform(-100,100))
+    aliens.descend(rng.uniform(0,100))
+    for i in range(30):
+        m=rng.randrange(ALIEN_ROWS)
+        n=rng.randrange(ALIENS_IN_ROW)
+        if aliens.isAlive(m,n):
+            aliens.kill(m,n)
+
+    live=[(m,n) for m in range(ALIEN_ROWS) for n in range(ALIENS_IN_ROW)
+          if aliens.isAlive(m,n)]
+    (x,y,w,h)=aliens.bounds()
+    left=min(aliens.columnX(n) for (m,n) in live)-ALIEN_WIDTH/2
+    right=max(aliens.columnX(n) for (m,n) in live)+ALIEN_WIDTH/2
+    bottom=min(aliens.rowY(m) for (m,n) in live)-ALIEN_HEIGHT/2
+    top=max(aliens.rowY(m) for (m,n) in live)+ALIEN_HEIGHT/2
+    assert x-w/2==pytest.approx(left)
+    assert x+w/2==pytest.approx(right)
+    assert y-h/2==pytest.approx(bottom)
+    assert y+h/2>=top-1e-9
+
+    # Bolts that travel far enough to cross several rows in one move
+    bolts=BoltBuffer()
+    for i in range(3*BOLT_VECTOR_MIN):
+        bolts.add(rng.uniform(x-w/2-20,x+w/2+20),
+                  rng.uniform(y-h/2-60,y+h/2+60),
+                  rng.choice([1,-1])*rng.uniform(BOLT_SPEED,4*ALIEN_HEIGHT))
+    bolts.advance()
+    assert bolts.getLive()>=BOLT_VECTOR_MIN
+    (bx,y0,y1,player,alive)=bolts.getValues()
+    for who in (True,False):
+        near=[k for (j,k) in sweepHits(bolts,[x],[y],w,h,who)]
+        found=0
+        for k in range(bolts.getCount()):
+            if player[k]!=who:
+                continue
+            expect=first_alien(aliens,bx[k],y0[k],y1[k])
+            assert aliens.hit(bx[k],y0[k],y1[k])==expect
+            if expect is not None:
+                assert k in near
+                found+=1
+        assert found>0
+
+
+@pytest.mark.parametrize('count',[BOLT_VECTOR_MIN-2,BOLT_VECTOR_MIN,48])
+def test_bolt_buffer(count):
+    """
+    Tests advance, cull and compact against plain lists, on both sides of
+    BOLT_VECTOR_MIN.
+    """
+    rng=random.Random(count)
+    bolts=BoltBuffer()
+    model=[]
+    def add(n):
+        for i in range(n):
+            velocity=rng.choice([1,-1])*rng.uniform(BOLT_SPEED,60)
+            x=rng.uniform(0,GAME_WIDTH)
+            y=rng.uniform(0,GAME_HEIGHT)
+            if bolts.add(x,y,velocity):
+                model.append([x,y,y,velocity,True])
+
+    add(count)
+    for step in range(40):
+        bolts.advance()
+        for bolt in model:
+            bolt[1]=bolt[2]
+            bolt[2]+=bolt[3]
+        for k in rng.sample(range(len(model)),len(model)//8):
+            bolts.kill(k)
+            model[k][4]=False
+        lost=False
+        for bolt in model:
+            top=bolt[2]+BOLT_HEIGHT/2
+            if bolt[4] and (top>=GAME_HEIGHT or top<=0):
+                bolt[4]=False
+                lost=lost or bolt[3]>0
+        assert bolts.cull()==lost
+        assert bolts.getLive()==sum(bolt[4] for bolt in model)
+        assert bolts.getLive(True)==sum(bolt[4] and bolt[3]>0 for bolt in model)
+        assert bolts.getAlive().tolist()==[bolt[4] for bolt in model]
+        bolts.compact()
+        model=[bolt for bolt in model if bolt[4]]
+        (x,lastY,y,player,alive)=bolts.getValues()
+        assert x==[bolt[0] for bolt in model]
+        assert lastY==[bolt[1] for bolt in model]
+        assert y==[bolt[2] for bolt in model]
+        assert player==[bolt[3]>0 for bolt in model]
+        assert alive==[True]*len(model)
+        assert bolts.getY().tolist()==y
+        add(rng.randrange(count//2+1))
+
+
+def test_column_bookkeeping():
+    """
+    Tests lowestInColumn and occupiedColumns as aliens are killed.
+    """
+    aliens=Formation()
+    everything=set(range(ALIENS_IN_ROW))
+    assert set(aliens.occupiedColumns())==everything
+    assert all(aliens.lowestInColumn(n)==ALIEN_ROWS-1
+               for n in range(ALIENS_IN_ROW))
+
+    # Killing the bottom alien moves the column up one row
+    aliens.kill(ALIEN_ROWS-1,2)
+    assert aliens.lowestInColumn(2)==ALIEN_ROWS-2
+    # Killing one above it changes nothing
+    aliens.kill(0,2)
+    assert aliens.lowestInColumn(2)==ALIEN_ROWS-2
+    assert set(aliens.occupiedColumns())==everything
+
+    # Emptying a whole column takes it out of the occupied columns
+    for m in range(ALIEN_ROWS):
+        if aliens.isAlive(m,5):
+            aliens.kill(m,5)
+    assert aliens.lowestInColumn(5)==-1
+    assert set(aliens.occupiedColumns())==everything-{5}
+    for m in range(ALIEN_ROWS):
+        if aliens.isAlive(m,2):
+            aliens.kill(m,2)
+    assert aliens.lowestInColumn(2)==-1
+    assert set(aliens.occupiedColumns())==everything-{2,5}
+    assert len(aliens.occupiedColumns())==ALIENS_IN_ROW-2
+
+    # Every column matches a search of the live aliens
+    rng=random.Random(6)
+    while not aliens.isEmpty():
+        m=rng.randrange(ALIEN_ROWS)
+        n=rng.randrange(ALIENS_IN_ROW)
+        if not aliens.isAlive(m,n):
+            continue
+        aliens.kill(m,n)
+        occupied=set()
+        for col in range(ALIENS_IN_ROW):
+            rows=[row for row in range(ALIEN_ROWS) if aliens.isAlive(row,col)]
+            assert aliens.lowestInColumn(col)==(max(rows) if rows else -1)
+            if rows:
+                occupied.add(col)
+        assert set(aliens.occupiedColumns())==occupied
+        assert len(aliens.occupiedColumns())==len(occupied)
+    assert aliens.occupiedColumns()==[]